@@ -1,27 +1,48 @@
-from flask import Flask
-from flask_cors import CORS
-from flask_migrate import Migrate
-from config import Config
-from extensions import db, ma
-from models import Tenant, Landlord, House, Payment, Message
-from routes import auth_bp, tenant_bp, landlord_bp, payments_bp
-
-app = Flask(__name__)
-app.config.from_object(Config)
-
-# Initialize extensions
-db.init_app(app)
-ma.init_app(app)
-migrate = Migrate(app, db)
-
-# Enable CORS
-CORS(app)
-
-# Register blueprints
-app.register_blueprint(auth_bp)
-app.register_blueprint(tenant_bp)
-app.register_blueprint(landlord_bp)
-app.register_blueprint(payments_bp)
-
-if __name__ == "__main__":
+from flask import Flask, jsonify
+from flask_cors import CORS
+from flask_migrate import Migrate
+from werkzeug.middleware.proxy_fix import ProxyFix
+from config import Config
+from extensions import db, ma, response_cache, audit_log, profiler, admission, portfolio, revocations
+from models import Tenant, Landlord, House, Payment, Message, Job, AuditEvent, RevokedToken, RoomType, Property
+from routes import auth_bp, tenant_bp, landlord_bp, payments_bp, house_bp, metrics_bp, property_bp
+from utils.auth import TokenError
+
+app = Flask(__name__)
+app.config.from_object(Config)
+
+# Take the client address from X-Forwarded-For set by trusted proxies
+if app.config["TRUSTED_PROXIES"]:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["TRUSTED_PROXIES"])
+
+# Initialize extensions
+db.init_app(app)
+ma.init_app(app)
+response_cache.init_app(app)
+audit_log.init_app(app)
+profiler.init_app(app)
+admission.init_app(app)
+portfolio.init_app(app)
+revocations.init_app(app)
+migrate = Migrate(app, db)
+
+# Enable CORS
+CORS(app)
+
+# Register blueprints
+app.register_blueprint(auth_bp)
+app.register_blueprint(tenant_bp)
+app.register_blueprint(landlord_bp)
+app.register_blueprint(payments_bp)
+app.register_blueprint(house_bp)
+app.register_blueprint(metrics_bp)
+app.register_blueprint(property_bp)
+
+
+# Expired, invalid or revoked tokens raised from get_user_from_token()
+@app.errorhandler(TokenError)
+def handle_token_error(e):
+    return jsonify({"error": str(e)}), 401
+
+if __name__ == "__main__":
     app.run(debug=True, port=5000)
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Payments partition maintenance and cold-storage archival
+Run from backend directory:
+    python archive_payments.py --ensure              # create upcoming monthly partitions
+    python archive_payments.py --before 2026-01      # archive every month before January 2026
+"""
+
+import argparse
+from app import app
+from config import Config
+from utils.partitions import ensure_payment_partitions, archive_payments, parse_month
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain and archive the payments table")
+    parser.add_argument("--ensure", action="store_true", help="create upcoming monthly partitions")
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument("--before", help="archive closed months before this month (YYYY-MM)")
+    parser.add_argument("--dir", default=Config.PAYMENTS_ARCHIVE_DIR, help="archive directory")
+    args = parser.parse_args()
+
+    with app.app_context():
+        if args.ensure:
+            created = ensure_payment_partitions(args.months_ahead)
+            print(f"✅ Partitions ready: {', '.join(created) or 'none (not PostgreSQL)'}")
+
+        if args.before:
+            try:
+                archived = archive_payments(parse_month(args.before), args.dir)
+            except ValueError as e:
+                parser.error(str(e))
+            for entry in archived:
+                print(f"   - {entry['month']}: {entry['rows']} payments archived")
+            print(f"✅ Archived {len(archived)} month(s) to {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Export payments, tenants and houses to Parquet (or Arrow IPC) for analytics
+Run from backend directory:
+    python export_ledger.py --dir exports                  # full export
+    python export_ledger.py --dir exports --incremental    # only payments added since the last run
+Tenants, houses and room types change in place, so they are always exported in full.
+"""
+
+import argparse
+import os
+from datetime import datetime
+from app import app
+from utils.export import EXPORT_TABLES, INCREMENTAL_TABLES, FORMATS, export_table, load_watermarks, save_watermarks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the ledger to columnar files")
+    parser.add_argument("--dir", default="exports", help="output directory")
+    parser.add_argument("--tables", nargs="+", default=list(EXPORT_TABLES), choices=list(EXPORT_TABLES))
+    parser.add_argument("--format", default="parquet", choices=FORMATS)
+    parser.add_argument("--chunk-size", type=int, default=50000, help="rows per row group")
+    parser.add_argument("--incremental", action="store_true",
+                        help="export only payment ids above the watermark saved by the previous run")
+    parser.add_argument("--since", help="payments only: export rows paid on or after this date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    os.makedirs(args.dir, exist_ok=True)
+    watermarks = load_watermarks(args.dir) if args.incremental else {}
+    since = datetime.fromisoformat(args.since) if args.since else None
+    extension = "parquet" if args.format == "parquet" else "arrow"
+
+    with app.app_context():
+        for table in args.tables:
+            since_id = watermarks.get(table, 0)
+            path = os.path.join(args.dir, f"{table}.{extension}.partial")
+
+            result = export_table(table, path, since_id=since_id, since=since,
+                                  chunk_size=args.chunk_size, fmt=args.format)
+            if table not in INCREMENTAL_TABLES:
+                # Full snapshot, replacing the previous one
+                os.replace(path, os.path.join(args.dir, f"{table}.{extension}"))
+                print(f"   - {table}: {result['rows']} rows (full)")
+                continue
+
+            if result["rows"] == 0:
+                os.remove(path)
+            else:
+                # Name files by the id range they hold: payments_0_1500.parquet, payments_1500_1720.parquet, ...
+                os.replace(path, os.path.join(args.dir, f"{table}_{since_id}_{result['max_id']}.{extension}"))
+            watermarks[table] = result["max_id"]
+            print(f"   - {table}: {result['rows']} rows, watermark id {result['max_id']}")
+
+    save_watermarks(args.dir, watermarks)
+    print(f"✅ Export finished in {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
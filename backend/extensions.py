@@ -1,5 +1,19 @@
-from flask_sqlalchemy import SQLAlchemy
-from flask_marshmallow import Marshmallow
-
-db = SQLAlchemy()
-ma = Marshmallow()
+from flask_sqlalchemy import SQLAlchemy
+from flask_marshmallow import Marshmallow
+from utils.cache import ResponseCache
+from utils.audit import AuditLog
+from utils.profiling import RequestProfiler
+from utils.admission import AdmissionControl
+from utils.portfolio import PortfolioSnapshot
+from utils.revocation import RevocationList
+from utils.room_types import RoomTypeMap
+
+db = SQLAlchemy()
+ma = Marshmallow()
+response_cache = ResponseCache()
+audit_log = AuditLog()
+profiler = RequestProfiler()
+admission = AdmissionControl()
+portfolio = PortfolioSnapshot()
+revocations = RevocationList()
+room_types = RoomTypeMap()
@@ -1,4 +1,5 @@
 import logging
+import re
 from logging.config import fileConfig
 
 from flask import current_app
@@ -45,6 +46,19 @@ target_db = current_app.extensions['migrate'].db
 # ... etc.
 
 
+# Tables that exist on purpose but are not in the models: the backfill
+# checkpoint table (created on demand by utils/backfill.py) and the monthly
+# payments partitions (created by utils/partitions.py). Without this,
+# autogenerate would emit a drop_table for each of them.
+UNMANAGED_TABLES = re.compile(r"^(backfill_checkpoints|payments_\d{4}_\d{2}|payments_default)$")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and reflected and compare_to is None:
+        return not UNMANAGED_TABLES.match(name)
+    return True
+
+
 def get_metadata():
     if hasattr(target_db, 'metadatas'):
         return target_db.metadatas[None]
@@ -65,7 +79,8 @@ def run_migrations_offline():
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=get_metadata(), literal_binds=True
+        url=url, target_metadata=get_metadata(), literal_binds=True,
+        include_object=include_object
     )
 
     with context.begin_transaction():
@@ -93,6 +108,8 @@ def run_migrations_online():
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    if conf_args.get("include_object") is None:
+        conf_args["include_object"] = include_object
 
     connectable = get_engine()
 
@@ -0,0 +1,39 @@
+"""add audit_events table
+
+Revision ID: add_audit_events_007
+Revises: add_jobs_006
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_audit_events_007'
+down_revision = 'add_jobs_006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('audit_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.String(length=32), nullable=False),
+    sa.Column('action', sa.String(length=50), nullable=False),
+    sa.Column('actor_role', sa.String(length=20), nullable=True),
+    sa.Column('actor_id', sa.Integer(), nullable=True),
+    sa.Column('tenant_id', sa.Integer(), nullable=True),
+    sa.Column('details', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id')
+    )
+    op.create_index('ix_audit_events_tenant_created', 'audit_events', ['tenant_id', 'created_at'])
+    op.create_index('ix_audit_events_created', 'audit_events', ['created_at'])
+
+
+def downgrade():
+    op.drop_index('ix_audit_events_created', table_name='audit_events')
+    op.drop_index('ix_audit_events_tenant_created', table_name='audit_events')
+    op.drop_table('audit_events')
@@ -0,0 +1,39 @@
+"""add capacity/occupied counters and availability indexes to houses
+
+Revision ID: add_house_occupancy_002
+Revises: add_room_type_001
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_house_occupancy_002'
+down_revision = 'add_room_type_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('houses', sa.Column('capacity', sa.Integer(), nullable=False, server_default='1'))
+    op.add_column('houses', sa.Column('occupied', sa.Integer(), nullable=False, server_default='0'))
+
+    # Seed the counter from current assignments in a single statement
+    op.execute(
+        "UPDATE houses SET occupied = "
+        "(SELECT COUNT(*) FROM tenants WHERE tenants.house_id = houses.id)"
+    )
+    # Houses that already hold several tenants must not start out over capacity
+    op.execute("UPDATE houses SET capacity = occupied WHERE occupied > capacity")
+
+    op.create_index('ix_houses_type_price', 'houses', ['type', 'price'])
+    op.create_index('ix_houses_landlord_id', 'houses', ['landlord_id'])
+
+
+def downgrade():
+    op.drop_index('ix_houses_landlord_id', table_name='houses')
+    op.drop_index('ix_houses_type_price', table_name='houses')
+    op.drop_column('houses', 'occupied')
+    op.drop_column('houses', 'capacity')
@@ -0,0 +1,77 @@
+"""add properties (buildings) between landlords and houses, with counters
+
+Revision ID: add_properties_011
+Revises: add_room_types_010
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+from utils.backfill import Backfill, reset
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_properties_011'
+down_revision = 'add_room_types_010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('properties',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('address', sa.String(length=255), nullable=True),
+    sa.Column('landlord_id', sa.Integer(), nullable=False),
+    sa.Column('units', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('occupied', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('expected_rent', sa.Numeric(precision=12, scale=2), nullable=False, server_default='0'),
+    sa.Column('collected', sa.Numeric(precision=12, scale=2), nullable=False, server_default='0'),
+    sa.Column('period', sa.String(length=7), nullable=True),
+    sa.ForeignKeyConstraint(['landlord_id'], ['landlords.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_properties_landlord_id', 'properties', ['landlord_id'])
+
+    with op.batch_alter_table('houses') as batch_op:
+        batch_op.add_column(sa.Column('property_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_houses_property_id', 'properties', ['property_id'], ['id'])
+        batch_op.create_index('ix_houses_property_id', ['property_id'])
+
+    # Existing houses start out in one building per landlord
+    op.execute(
+        "INSERT INTO properties (name, landlord_id) "
+        "SELECT landlords.name || ' - Main', landlords.id FROM landlords "
+        "WHERE EXISTS (SELECT 1 FROM houses WHERE houses.landlord_id = landlords.id)"
+    )
+
+    with op.get_context().autocommit_block():
+        Backfill(op.get_bind(), 'add_properties_011', 'houses').update(
+            "property_id = (SELECT MIN(id) FROM properties WHERE properties.landlord_id = houses.landlord_id)"
+        )
+
+    # Seed the counters with one statement over the (few) property rows
+    period = datetime.utcnow().strftime("%Y-%m")
+    op.execute(sa.text(
+        "UPDATE properties SET "
+        "units = (SELECT COALESCE(SUM(capacity), 0) FROM houses WHERE houses.property_id = properties.id), "
+        "occupied = (SELECT COUNT(*) FROM tenants JOIN houses ON houses.id = tenants.house_id "
+        "            WHERE houses.property_id = properties.id), "
+        "expected_rent = (SELECT COALESCE(SUM(houses.price), 0) FROM tenants JOIN houses ON houses.id = tenants.house_id "
+        "                 WHERE houses.property_id = properties.id), "
+        "collected = (SELECT COALESCE(SUM(payments.amount), 0) FROM payments "
+        "             JOIN tenants ON tenants.id = payments.tenant_id JOIN houses ON houses.id = tenants.house_id "
+        "             WHERE houses.property_id = properties.id AND payments.date_paid >= :period_start), "
+        "period = :period"
+    ).bindparams(period=period, period_start=datetime.strptime(period, "%Y-%m")))
+
+
+def downgrade():
+    with op.batch_alter_table('houses') as batch_op:
+        batch_op.drop_index('ix_houses_property_id')
+        batch_op.drop_constraint('fk_houses_property_id', type_='foreignkey')
+        batch_op.drop_column('property_id')
+    op.drop_index('ix_properties_landlord_id', table_name='properties')
+    op.drop_table('properties')
+    reset(op.get_bind(), 'add_properties_011')
@@ -0,0 +1,93 @@
+"""add room_types lookup table and integer room type keys
+
+Revision ID: add_room_types_010
+Revises: add_revoked_tokens_009
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from utils.backfill import Backfill, reset
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_room_types_010'
+down_revision = 'add_revoked_tokens_009'
+branch_labels = None
+depends_on = None
+
+# Inserted in this order, so ids 1-5 are the same on every deployment
+DEFAULT_ROOM_TYPES = ['Bedsitter', 'Studio', '1-Bedroom', '2-Bedroom', '3-Bedroom']
+
+
+# SQL twin of utils.room_types.squash
+def squashed(column):
+    return f"lower(replace(replace(replace({column}, '-', ''), ' ', ''), '_', ''))"
+
+
+def lookup(column):
+    return f"(SELECT id FROM room_types WHERE {squashed('name')} = {squashed(column)})"
+
+
+def upgrade():
+    room_types = op.create_table('room_types',
+    sa.Column('id', sa.SmallInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.bulk_insert(room_types, [{'name': name} for name in DEFAULT_ROOM_TYPES])
+
+    # Keep any other type found in tenants as its own row rather than losing it:
+    # one row per squashed key, so lookup() below always finds exactly one
+    op.execute(
+        "INSERT INTO room_types (name) "
+        "SELECT MIN(room_type) FROM tenants WHERE room_type IS NOT NULL "
+        f"AND {squashed('room_type')} NOT IN (SELECT {squashed('name')} FROM room_types) "
+        f"GROUP BY {squashed('room_type')}"
+    )
+
+    with op.batch_alter_table('tenants') as batch_op:
+        batch_op.add_column(sa.Column('room_type_id', sa.SmallInteger(), nullable=True))
+        batch_op.create_foreign_key('fk_tenants_room_type_id', 'room_types', ['room_type_id'], ['id'])
+        batch_op.create_index('ix_tenants_room_type_id', ['room_type_id'])
+    with op.batch_alter_table('houses') as batch_op:
+        batch_op.add_column(sa.Column('room_type_id', sa.SmallInteger(), nullable=True))
+        batch_op.create_foreign_key('fk_houses_room_type_id', 'room_types', ['room_type_id'], ['id'])
+        batch_op.create_index('ix_houses_room_type_price', ['room_type_id', 'price'])
+
+
+    # Chunked and committed per batch so tenants/houses are never locked for the whole run
+    with op.get_context().autocommit_block():
+        Backfill(op.get_bind(), 'add_room_types_010_tenants', 'tenants').update(
+            f"room_type_id = {lookup('room_type')}",
+            where="room_type IS NOT NULL"
+        )
+        # Houses only get a room type where their type is one ("residential" stays NULL)
+        Backfill(op.get_bind(), 'add_room_types_010_houses', 'houses').update(
+            f"room_type_id = {lookup('type')}"
+        )
+
+    # tenants.room_type stays until drop_tenant_room_type_012: code from
+    # before this revision may still be writing it while the backfill runs
+
+
+def downgrade():
+    # Carry room types set through room_type_id back to the old column
+    op.execute(
+        "UPDATE tenants SET room_type = "
+        "(SELECT name FROM room_types WHERE room_types.id = tenants.room_type_id) "
+        "WHERE room_type_id IS NOT NULL"
+    )
+
+    with op.batch_alter_table('houses') as batch_op:
+        batch_op.drop_index('ix_houses_room_type_price')
+        batch_op.drop_constraint('fk_houses_room_type_id', type_='foreignkey')
+        batch_op.drop_column('room_type_id')
+    with op.batch_alter_table('tenants') as batch_op:
+        batch_op.drop_index('ix_tenants_room_type_id')
+        batch_op.drop_constraint('fk_tenants_room_type_id', type_='foreignkey')
+        batch_op.drop_column('room_type_id')
+    op.drop_table('room_types')
+    reset(op.get_bind(), 'add_room_types_010_tenants')
+    reset(op.get_bind(), 'add_room_types_010_houses')
@@ -0,0 +1,44 @@
+"""cascade tenant deletes to payments and messages
+
+Revision ID: add_tenant_cascades_004
+Revises: add_tenant_search_003
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_tenant_cascades_004'
+down_revision = 'add_tenant_search_003'
+branch_labels = None
+depends_on = None
+
+
+def _replace_fk(table, ondelete):
+    name = f'{table}_tenant_id_fkey'
+    op.drop_constraint(name, table, type_='foreignkey')
+    op.create_foreign_key(name, table, 'tenants', ['tenant_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    # Constraint names follow PostgreSQL's defaults; SQLite cannot alter
+    # foreign keys in place and relies on the explicit deletes in utils.moveout
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Clear messages already orphaned by earlier tenant deletes
+    op.execute('DELETE FROM messages WHERE tenant_id IS NOT NULL '
+               'AND tenant_id NOT IN (SELECT id FROM tenants)')
+
+    _replace_fk('payments', 'CASCADE')
+    _replace_fk('messages', 'CASCADE')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _replace_fk('messages', None)
+    _replace_fk('payments', None)
@@ -0,0 +1,25 @@
+"""add tenants.house_id index
+
+Revision ID: add_tenant_house_index_013
+Revises: drop_tenant_room_type_012
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_tenant_house_index_013'
+down_revision = 'drop_tenant_room_type_012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves the house-number branch of tenant search (houses -> tenants)
+    op.create_index('ix_tenants_house_id', 'tenants', ['house_id'])
+
+
+def downgrade():
+    op.drop_index('ix_tenants_house_id', table_name='tenants')
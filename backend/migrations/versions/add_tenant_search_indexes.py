@@ -0,0 +1,42 @@
+"""add tenant search indexes
+
+Revision ID: add_tenant_search_003
+Revises: add_house_occupancy_002
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_tenant_search_003'
+down_revision = 'add_house_occupancy_002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # Trigram GIN indexes serve fuzzy/substring matches, the pattern_ops
+        # btrees serve the prefix LIKE used for short queries
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.execute('CREATE INDEX ix_tenants_name_trgm ON tenants USING gin (lower(name) gin_trgm_ops)')
+        op.execute('CREATE INDEX ix_tenants_email_trgm ON tenants USING gin (lower(email) gin_trgm_ops)')
+        op.execute('CREATE INDEX ix_tenants_name_lower ON tenants (lower(name) varchar_pattern_ops)')
+        op.execute('CREATE INDEX ix_tenants_email_lower ON tenants (lower(email) varchar_pattern_ops)')
+    else:
+        # Portable fallback: expression indexes serve the prefix range scans
+        op.create_index('ix_tenants_name_lower', 'tenants', [sa.text('lower(name)')])
+        op.create_index('ix_tenants_email_lower', 'tenants', [sa.text('lower(email)')])
+
+    op.create_index('ix_houses_number', 'houses', ['number'])
+
+
+def downgrade():
+    op.drop_index('ix_houses_number', table_name='houses')
+    op.drop_index('ix_tenants_email_lower', table_name='tenants')
+    op.drop_index('ix_tenants_name_lower', table_name='tenants')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_tenants_email_trgm', table_name='tenants')
+        op.drop_index('ix_tenants_name_trgm', table_name='tenants')
@@ -0,0 +1,60 @@
+"""drop tenants.room_type now that room_type_id is authoritative
+
+Contract step of add_room_types_010. Run it only once no code from before
+add_room_types_010 is serving requests: it catches up room types written to
+the old column since the backfill, then drops the column.
+
+Revision ID: drop_tenant_room_type_012
+Revises: add_properties_011
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from utils.backfill import Backfill, reset
+
+
+# revision identifiers, used by Alembic.
+revision = 'drop_tenant_room_type_012'
+down_revision = 'add_properties_011'
+branch_labels = None
+depends_on = None
+
+
+# Same lookup key as add_room_types_010 and utils.room_types.squash
+def squashed(column):
+    return f"lower(replace(replace(replace({column}, '-', ''), ' ', ''), '_', ''))"
+
+
+def lookup(column):
+    return f"(SELECT id FROM room_types WHERE {squashed('name')} = {squashed(column)})"
+
+
+def upgrade():
+    # Types first seen after the expand step, one row per squashed key
+    op.execute(
+        "INSERT INTO room_types (name) "
+        "SELECT MIN(room_type) FROM tenants WHERE room_type IS NOT NULL "
+        f"AND {squashed('room_type')} NOT IN (SELECT {squashed('name')} FROM room_types) "
+        f"GROUP BY {squashed('room_type')}"
+    )
+
+    # Re-apply the old column wherever it was written after the first backfill
+    with op.get_context().autocommit_block():
+        Backfill(op.get_bind(), 'drop_tenant_room_type_012', 'tenants').update(
+            f"room_type_id = {lookup('room_type')}",
+            where=f"room_type IS NOT NULL AND (room_type_id IS NULL OR room_type_id <> {lookup('room_type')})"
+        )
+
+    with op.batch_alter_table('tenants') as batch_op:
+        batch_op.drop_column('room_type')
+
+
+def downgrade():
+    with op.batch_alter_table('tenants') as batch_op:
+        batch_op.add_column(sa.Column('room_type', sa.String(length=100), nullable=True))
+    op.execute(
+        "UPDATE tenants SET room_type = "
+        "(SELECT name FROM room_types WHERE room_types.id = tenants.room_type_id)"
+    )
+    reset(op.get_bind(), 'drop_tenant_room_type_012')
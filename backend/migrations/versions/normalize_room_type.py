@@ -0,0 +1,44 @@
+"""normalize tenants.room_type to the names used for pricing
+
+Revision ID: normalize_room_type_008
+Revises: add_audit_events_007
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from utils.backfill import Backfill, reset
+
+
+# revision identifiers, used by Alembic.
+revision = 'normalize_room_type_008'
+down_revision = 'add_audit_events_007'
+branch_labels = None
+depends_on = None
+
+# Spellings found in the data (lowercased, without spaces/dashes) -> pricing names
+ROOM_TYPES = {
+    'bedsitter': 'Bedsitter',
+    'studio': 'Studio',
+    '1bedroom': '1-Bedroom',
+    '2bedroom': '2-Bedroom',
+    '3bedroom': '3-Bedroom',
+}
+
+
+def upgrade():
+    squashed = "lower(replace(replace(room_type, '-', ''), ' ', ''))"
+    cases = " ".join(f"WHEN '{raw}' THEN '{name}'" for raw, name in ROOM_TYPES.items())
+
+    # Chunked and committed per batch so tenants is never locked for the whole run
+    with op.get_context().autocommit_block():
+        Backfill(op.get_bind(), 'normalize_room_type_008', 'tenants').update(
+            f"room_type = CASE {squashed} {cases} ELSE room_type END",
+            where="room_type IS NOT NULL"
+        )
+
+
+def downgrade():
+    # The original spellings are not kept; normalized values stay as they are.
+    # Forget the checkpoint so upgrading again re-runs the backfill.
+    reset(op.get_bind(), 'normalize_room_type_008')
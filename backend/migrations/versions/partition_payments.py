@@ -0,0 +1,104 @@
+"""range-partition payments by date_paid month
+
+Revision ID: partition_payments_005
+Revises: add_tenant_cascades_004
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from datetime import date
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'partition_payments_005'
+down_revision = 'add_tenant_cascades_004'
+branch_labels = None
+depends_on = None
+
+# Partitions created ahead of the current month; archive_payments.py --ensure keeps this topped up
+MONTHS_AHEAD = 3
+
+
+def _next_month(d):
+    return date(d.year + d.month // 12, d.month % 12 + 1, 1)
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # Declarative partitioning is PostgreSQL-only; elsewhere the
+        # (tenant_id, date_paid) index still serves date-filtered queries
+        op.create_index('ix_payments_tenant_date', 'payments', ['tenant_id', 'date_paid'])
+        return
+
+    # The partition key must be part of the primary key, so it cannot be NULL
+    op.execute("UPDATE payments SET date_paid = now() WHERE date_paid IS NULL")
+
+    op.execute("ALTER TABLE payments RENAME TO payments_legacy")
+    op.execute("ALTER TABLE payments_legacy RENAME CONSTRAINT payments_pkey TO payments_legacy_pkey")
+    op.execute("ALTER TABLE payments_legacy RENAME CONSTRAINT payments_tenant_id_fkey TO payments_legacy_tenant_id_fkey")
+
+    op.execute("""
+        CREATE TABLE payments (
+            id integer NOT NULL DEFAULT nextval('payments_id_seq'),
+            tenant_id integer NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
+            amount numeric(10,2) NOT NULL,
+            payment_type varchar(50) NOT NULL,
+            date_paid timestamp NOT NULL DEFAULT now(),
+            status varchar(20),
+            PRIMARY KEY (id, date_paid)
+        ) PARTITION BY RANGE (date_paid)
+    """)
+    op.execute("ALTER SEQUENCE payments_id_seq OWNED BY payments.id")
+
+    # One partition per month from the oldest payment through MONTHS_AHEAD,
+    # plus a default partition so out-of-range rows are never rejected
+    oldest = bind.execute(sa.text("SELECT min(date_paid) FROM payments_legacy")).scalar()
+    month = date.today().replace(day=1)
+    if oldest is not None:
+        month = min(month, oldest.date().replace(day=1))
+    last = date.today().replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE payments_{month.year}_{month.month:02d} PARTITION OF payments "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        )
+        month = _next_month(month)
+    op.execute("CREATE TABLE payments_default PARTITION OF payments DEFAULT")
+
+    op.execute("""
+        INSERT INTO payments (id, tenant_id, amount, payment_type, date_paid, status)
+        SELECT id, tenant_id, amount, payment_type, date_paid, status FROM payments_legacy
+    """)
+    op.execute("DROP TABLE payments_legacy")
+
+    op.create_index('ix_payments_tenant_date', 'payments', ['tenant_id', 'date_paid'])
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        op.drop_index('ix_payments_tenant_date', table_name='payments')
+        return
+
+    op.execute("ALTER TABLE payments RENAME TO payments_partitioned")
+    op.execute("ALTER TABLE payments_partitioned RENAME CONSTRAINT payments_pkey TO payments_partitioned_pkey")
+    op.execute("""
+        CREATE TABLE payments (
+            id integer NOT NULL DEFAULT nextval('payments_id_seq') PRIMARY KEY,
+            tenant_id integer NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
+            amount numeric(10,2) NOT NULL,
+            payment_type varchar(50) NOT NULL,
+            date_paid timestamp DEFAULT now(),
+            status varchar(20)
+        )
+    """)
+    op.execute("ALTER SEQUENCE payments_id_seq OWNED BY payments.id")
+    op.execute("""
+        INSERT INTO payments (id, tenant_id, amount, payment_type, date_paid, status)
+        SELECT id, tenant_id, amount, payment_type, date_paid, status FROM payments_partitioned
+    """)
+    op.execute("DROP TABLE payments_partitioned CASCADE")
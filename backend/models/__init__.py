@@ -1,7 +1,12 @@
-from .tenant import Tenant
-from .landlord import Landlord
-from .house import House
-from .payment import Payment
-from .messages import Message
-
-__all__ = ['Tenant', 'Landlord', 'House', 'Payment', 'Message']
+from .tenant import Tenant
+from .landlord import Landlord
+from .house import House
+from .payment import Payment
+from .messages import Message
+from .job import Job
+from .audit import AuditEvent
+from .token import RevokedToken
+from .room_type import RoomType
+from .property import Property
+
+__all__ = ['Tenant', 'Landlord', 'House', 'Payment', 'Message', 'Job', 'AuditEvent', 'RevokedToken', 'RoomType', 'Property']
@@ -0,0 +1,17 @@
+from extensions import db
+from datetime import datetime
+
+class AuditEvent(db.Model):
+    __tablename__ = 'audit_events'
+    __table_args__ = (
+        db.Index('ix_audit_events_tenant_created', 'tenant_id', 'created_at'),
+        db.Index('ix_audit_events_created', 'created_at'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.String(32), unique=True, nullable=False)  # dedupes write-ahead replays
+    action = db.Column(db.String(50), nullable=False)  # signup, select_room, pay_bill, delete_tenant, ...
+    actor_role = db.Column(db.String(20), nullable=True)  # tenant, landlord, or None when unauthenticated
+    actor_id = db.Column(db.Integer, nullable=True)
+    tenant_id = db.Column(db.Integer, nullable=True)  # no FK: the trail outlives the tenant
+    details = db.Column(db.Text, nullable=True)  # JSON
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
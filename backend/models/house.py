@@ -1,10 +1,22 @@
-from extensions import db
-
-class House(db.Model):
-    __tablename__ = 'houses'
-    id = db.Column(db.Integer, primary_key=True)
-    number = db.Column(db.String(50), nullable=False)
-    price = db.Column(db.Numeric, nullable=False)
-    type = db.Column(db.String(50), nullable=False)
-    landlord_id = db.Column(db.Integer, db.ForeignKey('landlords.id'), nullable=False)
+from extensions import db
+
+class House(db.Model):
+    __tablename__ = 'houses'
+    __table_args__ = (
+        # Availability search filters on type/price and landlord, always with occupied < capacity
+        db.Index('ix_houses_type_price', 'type', 'price'),
+        db.Index('ix_houses_landlord_id', 'landlord_id'),
+        db.Index('ix_houses_number', 'number'),
+        db.Index('ix_houses_room_type_price', 'room_type_id', 'price'),
+        db.Index('ix_houses_property_id', 'property_id'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    number = db.Column(db.String(50), nullable=False)
+    price = db.Column(db.Numeric, nullable=False)
+    type = db.Column(db.String(50), nullable=False)
+    room_type_id = db.Column(db.SmallInteger, db.ForeignKey('room_types.id'), nullable=True)  # unit type offered, if uniform
+    landlord_id = db.Column(db.Integer, db.ForeignKey('landlords.id'), nullable=False)
+    property_id = db.Column(db.Integer, db.ForeignKey('properties.id'), nullable=True)  # building the house belongs to
+    capacity = db.Column(db.Integer, nullable=False, default=1, server_default='1')  # units in the house
+    occupied = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # tenants assigned, kept in sync by utils.occupancy
     tenants = db.relationship('Tenant', backref='house', uselist=True, lazy='select')
\ No newline at end of file
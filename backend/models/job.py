@@ -0,0 +1,20 @@
+from extensions import db
+from datetime import datetime
+
+class Job(db.Model):
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        # Workers claim the oldest runnable job: WHERE status = 'queued' AND run_at <= now ORDER BY run_at
+        db.Index('ix_jobs_status_run_at', 'status', 'run_at'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)  # handler name, e.g. "payment_receipt"
+    payload = db.Column(db.Text, nullable=False, default='{}')  # JSON arguments
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, done, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=5)
+    run_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)  # not picked up before this time
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
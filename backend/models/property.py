@@ -0,0 +1,18 @@
+from extensions import db
+
+class Property(db.Model):
+    __tablename__ = 'properties'
+    __table_args__ = (
+        db.Index('ix_properties_landlord_id', 'landlord_id'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    address = db.Column(db.String(255), nullable=True)
+    landlord_id = db.Column(db.Integer, db.ForeignKey('landlords.id'), nullable=False)
+    # Counters kept in sync by utils.properties on assignment, payment and move-out
+    units = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # sum of house capacities
+    occupied = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # units with a tenant
+    expected_rent = db.Column(db.Numeric(12, 2), nullable=False, default=0, server_default='0')  # sum of occupied unit prices
+    collected = db.Column(db.Numeric(12, 2), nullable=False, default=0, server_default='0')  # payments received in `period`
+    period = db.Column(db.String(7), nullable=True)  # "YYYY-MM" that `collected` belongs to
+    houses = db.relationship('House', backref='property', lazy='select')
@@ -0,0 +1,9 @@
+from extensions import db
+
+class RoomType(db.Model):
+    __tablename__ = 'room_types'
+    # Small reference table; tenants and houses point at it with 2-byte keys.
+    # Names match the pricing tables (RENT_PRICES), e.g. "1-Bedroom".
+    # SMALLSERIAL on PostgreSQL; SQLite only autoincrements INTEGER primary keys
+    id = db.Column(db.SmallInteger().with_variant(db.Integer, 'sqlite'), primary_key=True)
+    name = db.Column(db.String(50), unique=True, nullable=False)
@@ -1,15 +1,47 @@
-from extensions import db
-
-class Tenant(db.Model):
-    __tablename__ = 'tenants'
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
-    password = db.Column(db.String(255), nullable=False)
-    room_type = db.Column(db.String(100), nullable=True)  # e.g., "1bedroom", "2bedroom", "bedsitter"
-    house_id = db.Column(db.Integer, db.ForeignKey('houses.id'), nullable=True)
-    rent_paid = db.Column(db.Boolean, default=False)
-    water_bill_paid = db.Column(db.Boolean, default=False)
-    electricity_bill_paid = db.Column(db.Boolean, default=False)
-    payments = db.relationship('Payment', backref='tenant', lazy='select')
-    messages = db.relationship('Message', backref='tenant', lazy='select')
\ No newline at end of file
+from extensions import db, room_types
+
+class Tenant(db.Model):
+    __tablename__ = 'tenants'
+    __table_args__ = (
+        db.Index('ix_tenants_room_type_id', 'room_type_id'),
+        db.Index('ix_tenants_house_id', 'house_id'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    password = db.Column(db.String(255), nullable=False)
+    room_type_id = db.Column(db.SmallInteger, db.ForeignKey('room_types.id'), nullable=True)  # see room_type below
+    house_id = db.Column(db.Integer, db.ForeignKey('houses.id'), nullable=True)
+    rent_paid = db.Column(db.Boolean, default=False)
+    water_bill_paid = db.Column(db.Boolean, default=False)
+    electricity_bill_paid = db.Column(db.Boolean, default=False)
+    # The database cascades deletes to payments and messages (ON DELETE CASCADE)
+    payments = db.relationship('Payment', backref='tenant', lazy='select', passive_deletes=True)
+    messages = db.relationship('Message', backref='tenant', lazy='select', passive_deletes=True)
+
+    # Room type by name ("1-Bedroom"), translated through the in-memory room type map.
+    # Queries, group-bys and filters should use room_type_id.
+    @property
+    def room_type(self):
+        return room_types.name_for(self.room_type_id)
+
+    @room_type.setter
+    def room_type(self, name):
+        room_type_id = room_types.id_for(name)
+        if name and room_type_id is None:
+            raise ValueError(f"Unknown room type: {name}")
+        self.room_type_id = room_type_id
+
+
+# Search indexes (utils/search.py), declared as the migrations build them so
+# autogenerate sees no drift: prefix btrees on lower(name)/lower(email), with
+# varchar_pattern_ops on PostgreSQL so LIKE 'abc%' can use them, plus trigram
+# GIN indexes for fuzzy matching that exist on PostgreSQL only
+db.Index('ix_tenants_name_lower', db.func.lower(Tenant.name).label('name_lower'),
+         postgresql_ops={'name_lower': 'varchar_pattern_ops'})
+db.Index('ix_tenants_email_lower', db.func.lower(Tenant.email).label('email_lower'),
+         postgresql_ops={'email_lower': 'varchar_pattern_ops'})
+db.Index('ix_tenants_name_trgm', db.func.lower(Tenant.name).label('name_lower'),
+         postgresql_using='gin', postgresql_ops={'name_lower': 'gin_trgm_ops'}).ddl_if(dialect='postgresql')
+db.Index('ix_tenants_email_trgm', db.func.lower(Tenant.email).label('email_lower'),
+         postgresql_using='gin', postgresql_ops={'email_lower': 'gin_trgm_ops'}).ddl_if(dialect='postgresql')
@@ -0,0 +1,15 @@
+from extensions import db
+from datetime import datetime
+
+class RevokedToken(db.Model):
+    __tablename__ = 'revoked_tokens'
+    __table_args__ = (
+        # Expired rows are purged by expires_at
+        db.Index('ix_revoked_tokens_expires_at', 'expires_at'),
+        # Workers pull rows revoked since their last sync
+        db.Index('ix_revoked_tokens_revoked_at', 'revoked_at'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(32), unique=True, nullable=False)  # token id, or a whole refresh-token family
+    expires_at = db.Column(db.DateTime, nullable=False)  # after this the token is dead anyway
+    revoked_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
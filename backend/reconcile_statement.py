@@ -0,0 +1,52 @@
+"""
+Match a bank statement CSV to tenants and record the payments
+Run from backend directory:
+    python reconcile_statement.py statement.csv --dry-run               # preview only
+    python reconcile_statement.py statement.csv --unmatched review.csv  # write payments, save misses
+"""
+
+import argparse
+import csv
+from app import app, db
+from routes.landlord_routes import RENT_PRICES, UTILITY_BILLS
+from utils.reconcile import read_statement, reconcile_statement
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile a bank statement against tenants")
+    parser.add_argument("statement", help="CSV with an amount column plus date/reference/payer/email")
+    parser.add_argument("--dry-run", action="store_true", help="match and report without writing payments")
+    parser.add_argument("--unmatched", help="write lines that could not be applied to this CSV")
+    args = parser.parse_args()
+
+    with open(args.statement, encoding="utf-8-sig") as f:
+        lines, skipped = read_statement(f.read())
+
+    with app.app_context():
+        result = reconcile_statement(lines, RENT_PRICES, UTILITY_BILLS, dry_run=args.dry_run)
+        if args.dry_run:
+            db.session.rollback()
+        else:
+            db.session.commit()
+
+    if args.unmatched and result["unmatched"]:
+        with open(args.unmatched, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(result["unmatched"][0].keys()))
+            writer.writeheader()
+            writer.writerows(result["unmatched"])
+
+    print(f"   - lines: {result['lines']} ({skipped} skipped as debits or unreadable)")
+    print(f"   - matched: {result['matched']} ({result['match_rate']}%): "
+          f"{result['reference']} by reference, {result['email']} by email, "
+          f"{result['name']} by name, {result['fuzzy']} fuzzy")
+    print(f"   - unmatched: {result['no_tenant']} no tenant, {result['ambiguous']} ambiguous, "
+          f"{result['amount_mismatch']} amount does not fit outstanding bills")
+    print(f"   - timings: {result['timings_ms']} ({result['lines_per_second']} lines/s)")
+    if args.dry_run:
+        print("✅ Dry run finished, nothing written")
+    else:
+        print(f"✅ {result['payments_created']} payments recorded for {result['tenants_updated']} tenants")
+
+
+if __name__ == "__main__":
+    main()
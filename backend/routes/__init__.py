@@ -1,4 +1,7 @@
-from .auth_routes import auth_bp
-from .tenants_routes import tenant_bp
-from .landlord_routes import landlord_bp
-from .payments_routes import payments_bp
\ No newline at end of file
+from .auth_routes import auth_bp
+from .tenants_routes import tenant_bp
+from .landlord_routes import landlord_bp
+from .payments_routes import payments_bp
+from .house_routes import house_bp
+from .metrics_routes import metrics_bp
+from .property_routes import property_bp
\ No newline at end of file
@@ -1,8 +1,9 @@
 from flask import Blueprint, request, jsonify, current_app
 from models.tenant import Tenant
 from models.landlord import Landlord
-from extensions import db
-from utils.auth import hash_password, verify_password, create_token
+from datetime import datetime, timedelta
+from extensions import db, response_cache, audit_log, portfolio, revocations
+from utils.auth import hash_password, verify_password, create_token_pair, decode_token
 
 # Hardcoded landlord credentials
 LANDLORD_EMAIL = "johndoe@example.com"
@@ -43,9 +44,10 @@ def signup():
         landlord = Landlord(name="John Doe", email=email, password=hashed_password)
         db.session.add(landlord)
         db.session.commit()
+        audit_log.record("signup", "landlord", landlord.id)
         
-        token = create_token(landlord.id, "landlord")
-        return jsonify({"token": token, "user": {"id": landlord.id, "role": "landlord"}}), 201
+        tokens = create_token_pair(landlord.id, "landlord")
+        return jsonify({**tokens, "user": {"id": landlord.id, "role": "landlord"}}), 201
     else:
         # Tenant signup
         existing = Tenant.query.filter_by(email=email).first()
@@ -59,9 +61,12 @@ def signup():
         tenant = Tenant(name=name, email=email, password=hashed_password)
         db.session.add(tenant)
         db.session.commit()
+        response_cache.invalidate("dashboard")
+        portfolio.upsert(tenant)
+        audit_log.record("signup", "tenant", tenant.id, tenant.id)
         
-        token = create_token(tenant.id, "tenant")
-        return jsonify({"token": token, "user": {"id": tenant.id, "role": "tenant"}}), 201
+        tokens = create_token_pair(tenant.id, "tenant")
+        return jsonify({**tokens, "user": {"id": tenant.id, "role": "tenant"}}), 201
 
 
 @auth_bp.route("/login", methods=["POST"])
@@ -77,13 +82,74 @@ def login():
     # Try to find tenant first
     tenant = Tenant.query.filter_by(email=email).first()
     if tenant and verify_password(password, tenant.password):
-        token = create_token(tenant.id, "tenant")
-        return jsonify({"token": token, "user": {"id": tenant.id, "role": "tenant"}}), 200
+        tokens = create_token_pair(tenant.id, "tenant")
+        return jsonify({**tokens, "user": {"id": tenant.id, "role": "tenant"}}), 200
     
     # Try to find landlord
     landlord = Landlord.query.filter_by(email=email).first()
     if landlord and verify_password(password, landlord.password):
-        token = create_token(landlord.id, "landlord")
-        return jsonify({"token": token, "user": {"id": landlord.id, "role": "landlord"}}), 200
+        tokens = create_token_pair(landlord.id, "landlord")
+        return jsonify({**tokens, "user": {"id": landlord.id, "role": "landlord"}}), 200
     
     return jsonify({"error": "Invalid email or password"}), 401
+
+
+@auth_bp.route("/refresh", methods=["POST"])
+def refresh():
+    """Exchange a refresh token for a new access/refresh pair (the old one stops working)"""
+    data = request.get_json() or {}
+    refresh_token = data.get("refresh_token")
+
+    if not refresh_token:
+        return jsonify({"error": "refresh_token is required"}), 400
+
+    try:
+        payload = decode_token(refresh_token, token_type="refresh", check_revoked=False)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 401
+
+    expires_at = datetime.utcfromtimestamp(payload["exp"])
+    # Later refresh tokens in the family can live until REFRESH_TOKEN_DAYS from now
+    family_expires = datetime.utcnow() + timedelta(days=current_app.config.get("REFRESH_TOKEN_DAYS", 30))
+    if revocations.is_revoked(payload["fam"]):
+        return jsonify({"error": "Token has been revoked"}), 401
+
+    # Rotating out the old token is the claim: of two concurrent refreshes
+    # with the same token, only one inserts its revocation row
+    if not revocations.revoke(payload["jti"], expires_at):
+        # A rotated-out refresh token came back: treat the session as stolen
+        revocations.revoke(payload["fam"], family_expires)
+        db.session.commit()
+        revocations.remember(payload["fam"], family_expires)
+        audit_log.record("refresh_reuse", payload["role"], payload["user_id"])
+        return jsonify({"error": "Token has been revoked"}), 401
+    db.session.commit()
+    revocations.remember(payload["jti"], expires_at)
+
+    tokens = create_token_pair(payload["user_id"], payload["role"], payload["fam"])
+    return jsonify({**tokens, "user": {"id": payload["user_id"], "role": payload["role"]}}), 200
+
+
+@auth_bp.route("/logout", methods=["POST"])
+def logout():
+    """Revoke the current session: its access token and every refresh token in its family"""
+    auth = request.headers.get("Authorization")
+    if not auth:
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        payload = decode_token(auth.split(" ")[1])
+    except Exception as e:
+        return jsonify({"error": str(e)}), 401
+
+    if not payload.get("fam"):
+        return jsonify({"message": "Logged out"}), 200
+
+    # The family outlives the access token: keep it until its newest refresh token would expire
+    family_expires = datetime.utcnow() + timedelta(days=current_app.config.get("REFRESH_TOKEN_DAYS", 30))
+    revocations.revoke(payload["fam"], family_expires)
+    db.session.commit()
+    revocations.remember(payload["fam"], family_expires)
+    audit_log.record("logout", payload["role"], payload["user_id"])
+
+    return jsonify({"message": "Logged out"}), 200
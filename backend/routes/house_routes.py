@@ -0,0 +1,54 @@
+from flask import Blueprint, jsonify, request
+from models.house import House
+from extensions import room_types
+
+house_bp = Blueprint("houses", __name__, url_prefix="/api/houses")
+
+
+@house_bp.route("/available", methods=["GET"])
+def get_available_houses():
+    """Search houses with vacant units by type, room type, price range and landlord"""
+    try:
+        house_type = request.args.get("type")
+        room_type = request.args.get("room_type")
+        min_price = request.args.get("min_price", type=float)
+        max_price = request.args.get("max_price", type=float)
+        landlord_id = request.args.get("landlord_id", type=int)
+        limit = min(request.args.get("limit", 50, type=int), 200)
+
+        # Vacancy comes from the occupied counter, never from House.tenants
+        query = House.query.filter(House.occupied < House.capacity)
+        if house_type:
+            query = query.filter(House.type == house_type)
+        if room_type:
+            room_type_id = room_types.id_for(room_type)
+            if room_type_id is None:
+                return jsonify({"error": f"Unknown room type: {room_type}"}), 400
+            query = query.filter(House.room_type_id == room_type_id)
+        if min_price is not None:
+            query = query.filter(House.price >= min_price)
+        if max_price is not None:
+            query = query.filter(House.price <= max_price)
+        if landlord_id is not None:
+            query = query.filter(House.landlord_id == landlord_id)
+
+        houses = query.order_by(House.price, House.id).limit(limit).all()
+
+        houses_data = [
+            {
+                "id": h.id,
+                "number": h.number,
+                "type": h.type,
+                "room_type": room_types.name_for(h.room_type_id),
+                "price": float(h.price),
+                "landlord_id": h.landlord_id,
+                "capacity": h.capacity,
+                "occupied": h.occupied,
+                "vacant": h.capacity - h.occupied
+            }
+            for h in houses
+        ]
+
+        return jsonify(houses_data), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -1,198 +1,631 @@
-from flask import Blueprint, jsonify, request
-from models.tenant import Tenant
-from models.payment import Payment
-from models.house import House
-from extensions import db
-from utils.auth import decode_token
-
-landlord_bp = Blueprint("landlords", __name__, url_prefix="/api/landlords")
-
-# Rent pricing table
-RENT_PRICES = {
-    "Bedsitter": 5000,
-    "1-Bedroom": 8000,
-    "2-Bedroom": 12000,
-    "Studio": 6000,
-    "3-Bedroom": 15000,
-}
-
-UTILITY_BILLS = {
-    "water": 800,
-    "electricity": 1200,
-}
-
-
-def get_user_from_token():
-    auth = request.headers.get("Authorization")
-    if not auth:
-        return None
-    token = auth.split(" ")[1]
-    return decode_token(token)
-
-
-@landlord_bp.route("/tenants", methods=["GET"])
-def get_all_tenants():
-    """Get all tenants with payment details"""
-    payload = get_user_from_token()
-
-    if not payload or payload["role"] != "landlord":
-        return jsonify({"error": "Unauthorized"}), 403
-
-    try:
-        tenants = Tenant.query.all()
-        
-        tenants_data = []
-        for tenant in tenants:
-            # Calculate balance
-            balance = 0
-            if not tenant.rent_paid:
-                balance += RENT_PRICES.get(tenant.room_type, 0)
-            if not tenant.water_bill_paid:
-                balance += UTILITY_BILLS["water"]
-            if not tenant.electricity_bill_paid:
-                balance += UTILITY_BILLS["electricity"]
-            
-            tenants_data.append({
-                "id": tenant.id,
-                "name": tenant.name,
-                "email": tenant.email,
-                "room_type": tenant.room_type or "Not Selected",
-                "house_id": tenant.house_id,
-                "rent_paid": tenant.rent_paid,
-                "water_bill_paid": tenant.water_bill_paid,
-                "electricity_bill_paid": tenant.electricity_bill_paid,
-                "balance": balance,
-                "total_due": RENT_PRICES.get(tenant.room_type, 0) + 
-                            UTILITY_BILLS["water"] + 
-                            UTILITY_BILLS["electricity"]
-            })
-        
-        return jsonify(tenants_data), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@landlord_bp.route("/tenants/<int:tenant_id>", methods=["DELETE"])
-def delete_tenant(tenant_id):
-    """Delete a tenant (when they move out)"""
-    payload = get_user_from_token()
-
-    if not payload or payload["role"] != "landlord":
-        return jsonify({"error": "Unauthorized"}), 403
-
-    try:
-        tenant = Tenant.query.get(tenant_id)
-        if not tenant:
-            return jsonify({"error": "Tenant not found"}), 404
-        
-        # Delete associated payments
-        Payment.query.filter_by(tenant_id=tenant_id).delete()
-        
-        # Delete tenant
-        db.session.delete(tenant)
-        db.session.commit()
-        
-        return jsonify({"message": "Tenant removed successfully"}), 200
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
-
-
-@landlord_bp.route("/dashboard", methods=["GET"])
-def get_dashboard_summary():
-    """Get landlord dashboard summary stats"""
-    payload = get_user_from_token()
-
-    if not payload or payload["role"] != "landlord":
-        return jsonify({"error": "Unauthorized"}), 403
-
-    try:
-        tenants = Tenant.query.all()
-        
-        total_collected = 0
-        total_outstanding = 0
-        total_possible = 0
-        paid_count = 0
-        
-        for tenant in tenants:
-            rent = RENT_PRICES.get(tenant.room_type, 0)
-            total_due = rent + UTILITY_BILLS["water"] + UTILITY_BILLS["electricity"]
-            total_possible += total_due
-            
-            # Calculate collected
-            collected = 0
-            if tenant.rent_paid:
-                collected += rent
-            if tenant.water_bill_paid:
-                collected += UTILITY_BILLS["water"]
-            if tenant.electricity_bill_paid:
-                collected += UTILITY_BILLS["electricity"]
-            
-            total_collected += collected
-            
-            # Calculate outstanding
-            outstanding = total_due - collected
-            total_outstanding += outstanding
-            
-            if outstanding == 0:
-                paid_count += 1
-        
-        collection_rate = 0
-        if total_possible > 0:
-            collection_rate = int((total_collected / total_possible) * 100)
-        
-        return jsonify({
-            "total_tenants": len(tenants),
-            "paid_tenants": paid_count,
-            "unpaid_tenants": len(tenants) - paid_count,
-            "total_collected": total_collected,
-            "total_outstanding": total_outstanding,
-            "total_possible": total_possible,
-            "collection_rate": collection_rate,
-            "avg_balance": int(total_outstanding / len(tenants)) if len(tenants) > 0 else 0
-        }), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@landlord_bp.route("/payments", methods=["GET"])
-def get_payments_summary():
-    """Get payment history summary"""
-    payload = get_user_from_token()
-
-    if not payload or payload["role"] != "landlord":
-        return jsonify({"error": "Unauthorized"}), 403
-
-    try:
-        payments = Payment.query.all()
-        
-        payments_data = [
-            {
-                "id": p.id,
-                "tenant_id": p.tenant_id,
-                "tenant_name": p.tenant.name if p.tenant else "Unknown",
-                "amount": float(p.amount),
-                "payment_type": p.payment_type,
-                "status": p.status,
-                "date_paid": p.date_paid.isoformat() if p.date_paid else None
-            }
-            for p in payments
-        ]
-        
-        return jsonify(payments_data), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@landlord_bp.route("/me", methods=["GET"])
-def my_dashboard():
-    payload = get_user_from_token()
-
-    if not payload or payload["role"] != "landlord":
-        return jsonify({"error": "Unauthorized"}), 403
-
-    return jsonify({
-        "id": payload["user_id"],
-        "role": "landlord"
-    })
-
+from flask import Blueprint, jsonify, request, Response, current_app
+from models.tenant import Tenant
+from models.payment import Payment
+from models.house import House
+from models.audit import AuditEvent
+from extensions import db, response_cache, audit_log, portfolio, room_types
+from utils.auth import decode_token
+from utils.moveout import move_out_tenants
+from utils.search import search_tenants
+from utils.aging import build_aging_report, report_to_csv
+from utils.portfolio import simulate
+from utils.reconcile import read_statement, reconcile_statement
+from routes.payments_routes import parse_date_range, default_date_from, filter_by_date
+from utils.export import EXPORT_TABLES, INCREMENTAL_TABLES, FORMATS, export_table
+from datetime import datetime
+import json
+import math
+import os
+import tempfile
+import time
+
+landlord_bp = Blueprint("landlords", __name__, url_prefix="/api/landlords")
+
+# Rent pricing table
+RENT_PRICES = {
+    "Bedsitter": 5000,
+    "1-Bedroom": 8000,
+    "2-Bedroom": 12000,
+    "Studio": 6000,
+    "3-Bedroom": 15000,
+}
+
+UTILITY_BILLS = {
+    "water": 800,
+    "electricity": 1200,
+}
+
+
+def get_user_from_token():
+    auth = request.headers.get("Authorization")
+    if not auth:
+        return None
+    token = auth.split(" ")[1]
+    return decode_token(token)
+
+
+@landlord_bp.route("/tenants", methods=["GET"])
+def get_all_tenants():
+    """Get all tenants with payment details"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        tenants = Tenant.query.all()
+        
+        tenants_data = []
+        for tenant in tenants:
+            # Calculate balance
+            balance = 0
+            if not tenant.rent_paid:
+                balance += RENT_PRICES.get(tenant.room_type, 0)
+            if not tenant.water_bill_paid:
+                balance += UTILITY_BILLS["water"]
+            if not tenant.electricity_bill_paid:
+                balance += UTILITY_BILLS["electricity"]
+            
+            tenants_data.append({
+                "id": tenant.id,
+                "name": tenant.name,
+                "email": tenant.email,
+                "room_type": tenant.room_type or "Not Selected",
+                "house_id": tenant.house_id,
+                "rent_paid": tenant.rent_paid,
+                "water_bill_paid": tenant.water_bill_paid,
+                "electricity_bill_paid": tenant.electricity_bill_paid,
+                "balance": balance,
+                "total_due": RENT_PRICES.get(tenant.room_type, 0) + 
+                            UTILITY_BILLS["water"] + 
+                            UTILITY_BILLS["electricity"]
+            })
+        
+        return jsonify(tenants_data), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@landlord_bp.route("/tenants/search", methods=["GET"])
+def search_tenants_route():
+    """Search tenants by name, email or house number"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    q = request.args.get("q", "")
+    if not q.strip():
+        return jsonify({"error": "Query parameter q is required"}), 400
+
+    limit = min(request.args.get("limit", 20, type=int), 100)
+
+    try:
+        return jsonify(search_tenants(q, limit)), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@landlord_bp.route("/tenants/<int:tenant_id>", methods=["DELETE"])
+def delete_tenant(tenant_id):
+    """Delete a tenant (when they move out)"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        tenant = Tenant.query.get(tenant_id)
+        if not tenant:
+            return jsonify({"error": "Tenant not found"}), 404
+        
+        # Delete tenant with their payments and messages, freeing their unit
+        move_out_tenants([tenant_id])
+        db.session.commit()
+        response_cache.invalidate("dashboard", "payments")
+        portfolio.remove([tenant_id])
+        audit_log.record("delete_tenant", "landlord", payload["user_id"], tenant_id)
+        
+        return jsonify({"message": "Tenant removed successfully"}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+
+@landlord_bp.route("/tenants/move-out", methods=["POST"])
+def bulk_move_out():
+    """Move out many tenants at once (end of lease period)"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    data = request.get_json() or {}
+    tenant_ids = data.get("tenant_ids")
+
+    if not isinstance(tenant_ids, list) or not tenant_ids:
+        return jsonify({"error": "tenant_ids must be a non-empty list"}), 400
+    if not all(isinstance(i, int) for i in tenant_ids):
+        return jsonify({"error": "tenant_ids must contain integers"}), 400
+
+    try:
+        result = move_out_tenants(tenant_ids)
+        db.session.commit()
+        response_cache.invalidate("dashboard", "payments")
+        portfolio.remove(result["tenant_ids"])
+        for moved_id in result.pop("tenant_ids"):
+            audit_log.record("move_out", "landlord", payload["user_id"], moved_id,
+                             batch_size=result["tenants"])
+
+        result["requested"] = len(set(tenant_ids))
+        result["not_found"] = result["requested"] - result["tenants"]
+        return jsonify(result), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+
+def rent_expression():
+    """SQL expression for a tenant's rent, looked up from RENT_PRICES by room type id"""
+    prices = {room_types.id_for(name): price for name, price in RENT_PRICES.items()}
+    prices.pop(None, None)
+    return db.case(prices, value=Tenant.room_type_id, else_=0)
+
+
+def build_dashboard_summary():
+    """Compute dashboard summary stats for all tenants in one aggregate query"""
+    rent = rent_expression()
+    total_due = rent + UTILITY_BILLS["water"] + UTILITY_BILLS["electricity"]
+    collected = (
+        db.case((Tenant.rent_paid, rent), else_=0) +
+        db.case((Tenant.water_bill_paid, UTILITY_BILLS["water"]), else_=0) +
+        db.case((Tenant.electricity_bill_paid, UTILITY_BILLS["electricity"]), else_=0)
+    )
+
+    row = db.session.execute(
+        db.select(
+            db.func.count(Tenant.id),
+            db.func.coalesce(db.func.sum(total_due), 0),
+            db.func.coalesce(db.func.sum(collected), 0),
+            db.func.coalesce(db.func.sum(db.case((collected == total_due, 1), else_=0)), 0)
+        )
+    ).one()
+
+    tenant_count = row[0]
+    total_possible = int(row[1])
+    total_collected = int(row[2])
+    paid_count = int(row[3])
+    total_outstanding = total_possible - total_collected
+    
+    collection_rate = 0
+    if total_possible > 0:
+        collection_rate = int((total_collected / total_possible) * 100)
+    
+    return {
+        "total_tenants": tenant_count,
+        "paid_tenants": paid_count,
+        "unpaid_tenants": tenant_count - paid_count,
+        "total_collected": total_collected,
+        "total_outstanding": total_outstanding,
+        "total_possible": total_possible,
+        "collection_rate": collection_rate,
+        "avg_balance": int(total_outstanding / tenant_count) if tenant_count > 0 else 0
+    }
+
+
+@landlord_bp.route("/dashboard", methods=["GET"])
+def get_dashboard_summary():
+    """Get landlord dashboard summary stats"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        summary = response_cache.get_or_compute("dashboard", build_dashboard_summary)
+        return jsonify(summary), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@landlord_bp.route("/payments", methods=["GET"])
+def get_payments_summary():
+    """Get recent payment history summary; pass ?from= to go further back"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        date_from, date_to = parse_date_range()
+    except ValueError:
+        return jsonify({"error": "from and to must be dates in YYYY-MM-DD format"}), 400
+    date_from = default_date_from(date_from)
+
+    def build_payments_data():
+        payments = filter_by_date(Payment.query, date_from, date_to).all()
+        
+        return [
+            {
+                "id": p.id,
+                "tenant_id": p.tenant_id,
+                "tenant_name": p.tenant.name if p.tenant else "Unknown",
+                "amount": float(p.amount),
+                "payment_type": p.payment_type,
+                "status": p.status,
+                "date_paid": p.date_paid.isoformat() if p.date_paid else None
+            }
+            for p in payments
+        ]
+
+    try:
+        key = "payments:landlord:" + request.query_string.decode()
+        payments_data = response_cache.get_or_compute(key, build_payments_data)
+        return jsonify(payments_data), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@landlord_bp.route("/reports/aging", methods=["GET"])
+def get_aging_report():
+    """Get 30/60/90-day arrears aging by tenant, house or landlord (?format=csv for CSV)"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    group = request.args.get("group", "tenant")
+    if group not in ("tenant", "house", "landlord"):
+        return jsonify({"error": "group must be one of: tenant, house, landlord"}), 400
+
+    try:
+        report = build_aging_report(RENT_PRICES, UTILITY_BILLS, group)
+
+        if request.args.get("format") == "csv":
+            return Response(
+                report_to_csv(report),
+                mimetype="text/csv",
+                headers={"Content-Disposition": f"attachment; filename=aging_{group}.csv"}
+            )
+
+        return jsonify(report), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@landlord_bp.route("/simulate", methods=["POST"])
+def simulate_pricing():
+    """Project revenue and collection rate for what-if pricing scenarios"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    data = request.get_json() or {}
+    scenarios = data.get("scenarios")
+    house_ids = data.get("house_ids")
+    max_scenarios = current_app.config.get("SIMULATION_MAX_SCENARIOS", 1000)
+
+    if not isinstance(scenarios, list) or not scenarios:
+        return jsonify({"error": "scenarios must be a non-empty list"}), 400
+    if len(scenarios) > max_scenarios:
+        return jsonify({"error": f"At most {max_scenarios} scenarios per request"}), 400
+    for scenario in scenarios:
+        if not isinstance(scenario, dict) or not all(
+            isinstance(scenario.get(key, {}), dict) for key in ("rent_prices", "utility_bills")
+        ):
+            return jsonify({"error": "Each scenario must be an object with rent_prices/utility_bills objects"}), 400
+        prices = {**scenario.get("rent_prices", {}), **scenario.get("utility_bills", {})}
+        # bool is an int subclass; reject it and NaN/Infinity explicitly
+        if not all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v) and v >= 0
+            for v in prices.values()
+        ):
+            return jsonify({"error": "Prices must be non-negative numbers"}), 400
+        if set(scenario.get("utility_bills", {})) - set(UTILITY_BILLS):
+            return jsonify({"error": f"utility_bills may only set: {', '.join(UTILITY_BILLS)}"}), 400
+        # Prices are matched to tenants by the registered room type name
+        unknown = [name for name in scenario.get("rent_prices", {})
+                   if room_types.name_for(room_types.id_for(name)) != name]
+        if unknown:
+            return jsonify({"error": f"Unknown room types in rent_prices: {', '.join(unknown)}"}), 400
+    if house_ids is not None:
+        if not isinstance(house_ids, list):
+            return jsonify({"error": "house_ids must be a list"}), 400
+        if not all(isinstance(i, int) and not isinstance(i, bool) for i in house_ids):
+            return jsonify({"error": "house_ids must contain integers"}), 400
+
+    try:
+        started = time.perf_counter()
+        frame = portfolio.frame(house_ids)
+        named = [{"name": f"scenario_{i + 1}", **scenario} for i, scenario in enumerate(scenarios)]
+        results = simulate(frame, [{"name": "current"}] + named, RENT_PRICES, UTILITY_BILLS)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        return jsonify({
+            "tenants": len(frame["room_code"]),
+            "baseline": results[0],
+            "scenarios": results[1:],
+            "elapsed_ms": round(elapsed_ms, 2)
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@landlord_bp.route("/reconcile", methods=["POST"])
+def reconcile_bank_statement():
+    """Match a bank statement CSV to tenants and record the payments (?dry_run=1 to preview)"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    upload = request.files.get("statement")
+    text = upload.read().decode("utf-8-sig") if upload else request.get_data(as_text=True)
+    if not text.strip():
+        return jsonify({"error": "Upload the statement as 'statement' or send CSV as the request body"}), 400
+
+    try:
+        lines, skipped = read_statement(text)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    dry_run = request.args.get("dry_run") in ("1", "true")
+
+    try:
+        result = reconcile_statement(lines, RENT_PRICES, UTILITY_BILLS, dry_run=dry_run)
+        if dry_run:
+            db.session.rollback()
+        else:
+            db.session.commit()
+            response_cache.invalidate("dashboard", "payments")
+            portfolio.expire()
+            audit_log.record("reconcile", "landlord", payload["user_id"],
+                             lines=result["lines"], matched=result["matched"],
+                             payments=result["payments_created"])
+
+        result["skipped"] = skipped
+        result["unmatched_count"] = len(result["unmatched"])
+        result["unmatched"] = result["unmatched"][:500]
+        return jsonify(result), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+
+@landlord_bp.route("/export/<table>", methods=["GET"])
+def export_ledger(table):
+    """Download payments, tenants or houses as Parquet/Arrow (?since_id= for incremental payment pulls)"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    if table not in EXPORT_TABLES:
+        return jsonify({"error": f"Unknown table. Choose from: {', '.join(EXPORT_TABLES)}"}), 400
+
+    fmt = request.args.get("format", "parquet")
+    if fmt not in FORMATS:
+        return jsonify({"error": f"Unknown format. Choose from: {', '.join(FORMATS)}"}), 400
+
+    since_id = request.args.get("since_id", 0, type=int)
+    since = request.args.get("since")
+    try:
+        since = datetime.fromisoformat(since) if since else None
+    except ValueError:
+        return jsonify({"error": "since must be an ISO date or datetime"}), 400
+
+    # Write to disk in chunks, then stream the file back. The file is deleted
+    # when the response is closed (even if it was never iterated), or right
+    # away if the export fails.
+    fd, path = tempfile.mkstemp(suffix=f".{fmt}")
+    os.close(fd)
+    try:
+        result = export_table(table, path, since_id=since_id, since=since, fmt=fmt)
+    except Exception as e:
+        os.remove(path)
+        return jsonify({"error": str(e)}), 500
+
+    def stream():
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                yield chunk
+
+    headers = {
+        "Content-Length": str(os.path.getsize(path)),
+        "X-Export-Rows": str(result["rows"]),
+    }
+    if table in INCREMENTAL_TABLES:
+        filename = f"{table}_{result['since_id']}_{result['max_id']}.{fmt}"
+        headers["X-Export-Watermark"] = str(result["max_id"])
+    else:
+        filename = f"{table}.{fmt}"
+    headers["Content-Disposition"] = f"attachment; filename={filename}"
+
+    response = Response(stream(), mimetype="application/octet-stream", headers=headers)
+    # Runs after the generator is closed, so the file is no longer open
+    response.call_on_close(lambda: os.remove(path))
+    return response
+
+
+@landlord_bp.route("/audit", methods=["GET"])
+def get_audit_events():
+    """Get audit events, optionally for one tenant and a time range (?from=&to= ISO datetimes)"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        tenant_id = request.args.get("tenant_id", type=int)
+        date_from = request.args.get("from")
+        date_to = request.args.get("to")
+        limit = min(request.args.get("limit", 100, type=int), 1000)
+
+        query = AuditEvent.query
+        if tenant_id is not None:
+            query = query.filter(AuditEvent.tenant_id == tenant_id)
+        if date_from:
+            query = query.filter(AuditEvent.created_at >= datetime.fromisoformat(date_from))
+        if date_to:
+            query = query.filter(AuditEvent.created_at < datetime.fromisoformat(date_to))
+
+        events = query.order_by(AuditEvent.created_at.desc(), AuditEvent.id.desc()).limit(limit).all()
+
+        return jsonify([
+            {
+                "id": e.id,
+                "action": e.action,
+                "actor_role": e.actor_role,
+                "actor_id": e.actor_id,
+                "tenant_id": e.tenant_id,
+                "details": json.loads(e.details) if e.details else None,
+                "created_at": e.created_at.isoformat()
+            }
+            for e in events
+        ]), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+OVERVIEW_PANELS = ("summary", "tenants", "payments")
+
+
+def parse_fields(value):
+    """Parse ?fields=summary,tenants.name,tenants.balance into {panel: set of fields or None}"""
+    if not value:
+        return {panel: None for panel in OVERVIEW_PANELS}
+
+    selected = {}
+    for item in value.split(","):
+        panel, _, field = item.strip().partition(".")
+        if panel not in OVERVIEW_PANELS:
+            raise ValueError(f"Unknown field '{item}'. Panels: {', '.join(OVERVIEW_PANELS)}")
+        if field:
+            if selected.get(panel, set()) is not None:
+                selected.setdefault(panel, set()).add(field)
+        else:
+            selected[panel] = None
+    return selected
+
+
+def pick(item, fields):
+    return item if fields is None else {k: v for k, v in item.items() if k in fields}
+
+
+@landlord_bp.route("/overview", methods=["GET"])
+def get_overview():
+    """Get summary stats, a page of tenants and recent payments in one request"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        selected = parse_fields(request.args.get("fields"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    page = max(request.args.get("page", 1, type=int), 1)
+    page_size = min(max(request.args.get("page_size", 20, type=int), 1), 500)
+    payments_limit = min(max(request.args.get("payments_limit", 10, type=int), 1), 500)
+
+    def build_overview():
+        # Every panel reads from the same snapshot. The isolation level only
+        # applies to a transaction that has not started yet, so end whatever
+        # read transaction this request already began (nothing is pending on
+        # a GET) and open a fresh one at REPEATABLE READ before any panel query.
+        if db.session.get_bind().dialect.name == "postgresql":
+            db.session.rollback()
+            db.session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+        overview = {}
+        summary = None
+
+        if "summary" in selected:
+            summary = build_dashboard_summary()
+            overview["summary"] = pick(summary, selected["summary"])
+
+        if "tenants" in selected:
+            if summary is not None:
+                total = summary["total_tenants"]
+            else:
+                total = db.session.execute(db.select(db.func.count(Tenant.id))).scalar()
+
+            tenants = (
+                Tenant.query.order_by(Tenant.id)
+                .offset((page - 1) * page_size).limit(page_size).all()
+            )
+            items = []
+            for tenant in tenants:
+                rent = RENT_PRICES.get(tenant.room_type, 0)
+                balance = 0
+                if not tenant.rent_paid:
+                    balance += rent
+                if not tenant.water_bill_paid:
+                    balance += UTILITY_BILLS["water"]
+                if not tenant.electricity_bill_paid:
+                    balance += UTILITY_BILLS["electricity"]
+                items.append(pick({
+                    "id": tenant.id,
+                    "name": tenant.name,
+                    "email": tenant.email,
+                    "room_type": tenant.room_type or "Not Selected",
+                    "house_id": tenant.house_id,
+                    "rent_paid": tenant.rent_paid,
+                    "water_bill_paid": tenant.water_bill_paid,
+                    "electricity_bill_paid": tenant.electricity_bill_paid,
+                    "balance": balance,
+                    "total_due": rent + UTILITY_BILLS["water"] + UTILITY_BILLS["electricity"]
+                }, selected["tenants"]))
+
+            overview["tenants"] = {"items": items, "page": page, "page_size": page_size, "total": total}
+
+        if "payments" in selected:
+            # Join for tenant names instead of lazy-loading p.tenant per row
+            rows = db.session.execute(
+                db.select(Payment, Tenant.name)
+                .outerjoin(Tenant, Tenant.id == Payment.tenant_id)
+                .order_by(Payment.date_paid.desc(), Payment.id.desc())
+                .limit(payments_limit)
+            ).all()
+            overview["payments"] = [
+                pick({
+                    "id": p.id,
+                    "tenant_id": p.tenant_id,
+                    "tenant_name": name or "Unknown",
+                    "amount": float(p.amount),
+                    "payment_type": p.payment_type,
+                    "status": p.status,
+                    "date_paid": p.date_paid.isoformat() if p.date_paid else None
+                }, selected["payments"])
+                for p, name in rows
+            ]
+
+        db.session.commit()
+        return overview
+
+    try:
+        # Cached under the dashboard prefix, so every write that changes the
+        # dashboard also drops overview entries
+        key = "dashboard:overview:" + request.query_string.decode()
+        return jsonify(response_cache.get_or_compute(key, build_overview)), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+
+@landlord_bp.route("/me", methods=["GET"])
+def my_dashboard():
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    return jsonify({
+        "id": payload["user_id"],
+        "role": "landlord"
+    })
+
@@ -0,0 +1,33 @@
+from flask import Blueprint, jsonify, request
+from extensions import response_cache, audit_log, profiler, admission, portfolio, revocations
+from utils.auth import decode_token
+from utils.jobs import queue_metrics
+
+metrics_bp = Blueprint("metrics", __name__, url_prefix="/api/metrics")
+
+
+def get_user_from_token():
+    auth = request.headers.get("Authorization")
+    if not auth:
+        return None
+    token = auth.split(" ")[1]
+    return decode_token(token)
+
+
+@metrics_bp.route("/", methods=["GET"])
+def get_metrics():
+    """Get runtime counters (cache ratios, job queue depth and lag, audit buffer, profiling, shed and rate-limited requests, portfolio snapshot, token revocation list)"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    return jsonify({
+        "response_cache": response_cache.stats(),
+        "jobs": queue_metrics(),
+        "audit": audit_log.stats(),
+        "profiling": profiler.stats(),
+        "admission": admission.stats(),
+        "portfolio": portfolio.stats(),
+        "revocations": revocations.stats()
+    }), 200
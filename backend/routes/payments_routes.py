@@ -1,52 +1,114 @@
-from flask import Blueprint, jsonify, request
-from models.payment import Payment
-from models.tenant import Tenant
-from extensions import db
-
-payments_bp = Blueprint("payments", __name__, url_prefix="/api/payments")
-
-
-@payments_bp.route("/", methods=["GET"])
-def get_all_payments():
-    """Get all payments for payment history"""
-    try:
-        payments = Payment.query.all()
-        
-        payments_data = [
-            {
-                "id": p.id,
-                "tenant_id": p.tenant_id,
-                "tenant_name": p.tenant.name if p.tenant else "Unknown",
-                "amount": float(p.amount),
-                "payment_type": p.payment_type,
-                "status": p.status,
-                "date_paid": p.date_paid.isoformat() if p.date_paid else None
-            }
-            for p in payments
-        ]
-        
-        return jsonify(payments_data), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@payments_bp.route("/tenant/<int:tenant_id>", methods=["GET"])
-def get_tenant_payments(tenant_id):
-    """Get payment history for a specific tenant"""
-    try:
-        payments = Payment.query.filter_by(tenant_id=tenant_id).all()
-        
-        payments_data = [
-            {
-                "id": p.id,
-                "amount": float(p.amount),
-                "payment_type": p.payment_type,
-                "status": p.status,
-                "date_paid": p.date_paid.isoformat() if p.date_paid else None
-            }
-            for p in payments
-        ]
-        
-        return jsonify(payments_data), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+from flask import Blueprint, jsonify, request, current_app
+from models.payment import Payment
+from models.tenant import Tenant
+from extensions import db, response_cache
+from utils.partitions import read_archived_payments, parse_month, recent_window_start
+from datetime import datetime
+
+payments_bp = Blueprint("payments", __name__, url_prefix="/api/payments")
+
+
+def parse_date_range():
+    """Read optional ?from=&to= (YYYY-MM-DD) bounds; raises ValueError on bad values"""
+    date_from = request.args.get("from")
+    date_to = request.args.get("to")
+    return (
+        datetime.fromisoformat(date_from) if date_from else None,
+        datetime.fromisoformat(date_to) if date_to else None
+    )
+
+
+def default_date_from(date_from):
+    """Fall back to the recent window when no ?from= was given"""
+    if date_from:
+        return date_from
+    start = recent_window_start(current_app.config["PAYMENTS_RECENT_MONTHS"])
+    return datetime(start.year, start.month, start.day)
+
+
+def filter_by_date(query, date_from, date_to):
+    """Apply the date bounds so PostgreSQL prunes partitions"""
+    if date_from:
+        query = query.filter(Payment.date_paid >= date_from)
+    if date_to:
+        query = query.filter(Payment.date_paid < date_to)
+    return query
+
+
+@payments_bp.route("/", methods=["GET"])
+def get_all_payments():
+    """Get recent payments for payment history; pass ?from= to go further back"""
+    try:
+        date_from, date_to = parse_date_range()
+    except ValueError:
+        return jsonify({"error": "from and to must be dates in YYYY-MM-DD format"}), 400
+    date_from = default_date_from(date_from)
+
+    def build_payments_data():
+        payments = filter_by_date(Payment.query, date_from, date_to).all()
+        
+        return [
+            {
+                "id": p.id,
+                "tenant_id": p.tenant_id,
+                "tenant_name": p.tenant.name if p.tenant else "Unknown",
+                "amount": float(p.amount),
+                "payment_type": p.payment_type,
+                "status": p.status,
+                "date_paid": p.date_paid.isoformat() if p.date_paid else None
+            }
+            for p in payments
+        ]
+
+    try:
+        # Key on the query string so each date window is cached separately
+        key = "payments:all:" + request.query_string.decode()
+        payments_data = response_cache.get_or_compute(key, build_payments_data)
+        return jsonify(payments_data), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@payments_bp.route("/tenant/<int:tenant_id>", methods=["GET"])
+def get_tenant_payments(tenant_id):
+    """Get payment history for a specific tenant"""
+    try:
+        date_from, date_to = parse_date_range()
+    except ValueError:
+        return jsonify({"error": "from and to must be dates in YYYY-MM-DD format"}), 400
+
+    try:
+        payments = filter_by_date(Payment.query.filter_by(tenant_id=tenant_id), date_from, date_to).all()
+        
+        payments_data = [
+            {
+                "id": p.id,
+                "amount": float(p.amount),
+                "payment_type": p.payment_type,
+                "status": p.status,
+                "date_paid": p.date_paid.isoformat() if p.date_paid else None
+            }
+            for p in payments
+        ]
+        
+        return jsonify(payments_data), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@payments_bp.route("/archive/<month>", methods=["GET"])
+def get_archived_payments(month):
+    """Get archived payments for a closed month (YYYY-MM), optionally for one tenant"""
+    try:
+        month_date = parse_month(month)
+    except ValueError:
+        return jsonify({"error": "Month must be in YYYY-MM format"}), 400
+
+    try:
+        tenant_id = request.args.get("tenant_id", type=int)
+        payments_data = read_archived_payments(
+            current_app.config["PAYMENTS_ARCHIVE_DIR"], month_date, tenant_id
+        )
+        return jsonify(payments_data), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
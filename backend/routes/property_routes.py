@@ -0,0 +1,215 @@
+from flask import Blueprint, jsonify, request
+from models.property import Property
+from models.house import House
+from models.tenant import Tenant
+from extensions import db, audit_log, room_types
+from utils.auth import decode_token
+from utils.properties import collected_this_period, current_period, recount_properties
+
+property_bp = Blueprint("properties", __name__, url_prefix="/api/properties")
+
+
+def get_user_from_token():
+    auth = request.headers.get("Authorization")
+    if not auth:
+        return None
+    token = auth.split(" ")[1]
+    return decode_token(token)
+
+
+def property_summary(prop):
+    """Counters for one property, read straight from its row"""
+    collected = collected_this_period(prop)
+    expected = prop.expected_rent or 0
+    return {
+        "id": prop.id,
+        "name": prop.name,
+        "address": prop.address,
+        "units": prop.units,
+        "occupied": prop.occupied,
+        "vacant": prop.units - prop.occupied,
+        "occupancy_rate": round(prop.occupied * 100 / prop.units, 1) if prop.units else 0,
+        "expected_rent": float(expected),
+        "collected": float(collected),
+        "collection_rate": round(float(collected) * 100 / float(expected), 1) if expected else 0,
+        "period": current_period()
+    }
+
+
+def get_owned_property(property_id, landlord_id):
+    prop = db.session.get(Property, property_id)
+    if prop is None or prop.landlord_id != landlord_id:
+        return None
+    return prop
+
+
+@property_bp.route("/", methods=["GET"])
+def get_properties():
+    """Get every property of the landlord with its counters, plus portfolio totals"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        # One indexed read of the landlord's property rows; no house, tenant or payment scans
+        properties = (
+            Property.query.filter_by(landlord_id=payload["user_id"])
+            .order_by(Property.name, Property.id).all()
+        )
+        items = [property_summary(p) for p in properties]
+
+        totals = {
+            key: sum(item[key] for item in items)
+            for key in ("units", "occupied", "vacant", "expected_rent", "collected")
+        }
+        totals["properties"] = len(items)
+        totals["occupancy_rate"] = round(totals["occupied"] * 100 / totals["units"], 1) if totals["units"] else 0
+        totals["collection_rate"] = (
+            round(totals["collected"] * 100 / totals["expected_rent"], 1) if totals["expected_rent"] else 0
+        )
+
+        return jsonify({"totals": totals, "properties": items, "period": current_period()}), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@property_bp.route("/", methods=["POST"])
+def create_property():
+    """Create a property (building)"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    data = request.get_json() or {}
+    name = data.get("name")
+    if not name:
+        return jsonify({"error": "Name is required"}), 400
+
+    try:
+        prop = Property(name=name, address=data.get("address"), landlord_id=payload["user_id"],
+                        period=current_period())
+        db.session.add(prop)
+        db.session.commit()
+        audit_log.record("create_property", "landlord", payload["user_id"], property_id=prop.id)
+
+        return jsonify(property_summary(prop)), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+
+@property_bp.route("/<int:property_id>", methods=["GET"])
+def get_property(property_id):
+    """Get one property's counters and its houses"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        prop = get_owned_property(property_id, payload["user_id"])
+        if not prop:
+            return jsonify({"error": "Property not found"}), 404
+
+        houses = House.query.filter_by(property_id=prop.id).order_by(House.number, House.id).all()
+
+        return jsonify({
+            **property_summary(prop),
+            "houses": [
+                {
+                    "id": h.id,
+                    "number": h.number,
+                    "type": h.type,
+                    "room_type": room_types.name_for(h.room_type_id),
+                    "price": float(h.price),
+                    "capacity": h.capacity,
+                    "occupied": h.occupied,
+                    "vacant": h.capacity - h.occupied
+                }
+                for h in houses
+            ]
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@property_bp.route("/<int:property_id>/houses/<int:house_id>", methods=["GET"])
+def get_property_house(property_id, house_id):
+    """Get the tenants living in one house of a property"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    try:
+        prop = get_owned_property(property_id, payload["user_id"])
+        house = db.session.get(House, house_id)
+        if not prop or not house or house.property_id != prop.id:
+            return jsonify({"error": "House not found"}), 404
+
+        tenants = Tenant.query.filter_by(house_id=house.id).order_by(Tenant.name, Tenant.id).all()
+
+        return jsonify({
+            "id": house.id,
+            "number": house.number,
+            "property_id": prop.id,
+            "price": float(house.price),
+            "capacity": house.capacity,
+            "occupied": house.occupied,
+            "tenants": [
+                {
+                    "id": t.id,
+                    "name": t.name,
+                    "room_type": t.room_type or "Not Selected",
+                    "rent_paid": t.rent_paid,
+                    "water_bill_paid": t.water_bill_paid,
+                    "electricity_bill_paid": t.electricity_bill_paid
+                }
+                for t in tenants
+            ]
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@property_bp.route("/<int:property_id>/houses", methods=["POST"])
+def attach_houses(property_id):
+    """Move houses into a property; both buildings' counters are recomputed"""
+    payload = get_user_from_token()
+
+    if not payload or payload["role"] != "landlord":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    data = request.get_json() or {}
+    house_ids = data.get("house_ids")
+
+    if not isinstance(house_ids, list) or not house_ids:
+        return jsonify({"error": "house_ids must be a non-empty list"}), 400
+    if not all(isinstance(i, int) for i in house_ids):
+        return jsonify({"error": "house_ids must contain integers"}), 400
+
+    try:
+        prop = get_owned_property(property_id, payload["user_id"])
+        if not prop:
+            return jsonify({"error": "Property not found"}), 404
+
+        houses = House.query.filter(House.id.in_(house_ids), House.landlord_id == prop.landlord_id).all()
+        if len(houses) != len(set(house_ids)):
+            return jsonify({"error": "Some houses were not found"}), 404
+
+        affected = {prop.id} | {h.property_id for h in houses if h.property_id}
+        for house in houses:
+            house.property_id = prop.id
+        db.session.flush()
+        recount_properties(list(affected))
+        db.session.commit()
+        audit_log.record("attach_houses", "landlord", payload["user_id"],
+                         property_id=prop.id, house_ids=sorted(set(house_ids)))
+
+        db.session.refresh(prop)
+        return jsonify(property_summary(prop)), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
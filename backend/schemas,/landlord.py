@@ -1,11 +1,11 @@
-from extensions import ma
-
-class LandlordSchema(ma.Schema):
-    class Meta:
-        fields = (
-            "id",
-            "name",
-            "email",
-            "created_at"
-        )
-        ordered = True
+from extensions import ma
+
+class LandlordSchema(ma.Schema):
+    class Meta:
+        fields = (
+            "id",
+            "name",
+            "email",
+            "created_at"
+        )
+        ordered = True
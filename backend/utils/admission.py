@@ -0,0 +1,128 @@
+# admission.py
+import math
+import threading
+import time
+from flask import g, jsonify, request
+
+
+# Per-client token bucket: `rate` tokens per second, up to `burst` saved up
+class TokenBucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, burst: float):
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    # Take one token, or return how many seconds until one is available
+    def take(self, rate: float, burst: float) -> float:
+        now = time.monotonic()
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / rate
+
+
+# In-process admission control, checked before each request:
+#   1. per-client token-bucket rate limits on selected endpoints -> 429
+#   2. per-endpoint concurrency limits; a request that cannot get a slot
+#      within the queue-time budget is shed with a fast 503
+# Both responses carry Retry-After.
+class AdmissionControl:
+    # Buckets kept per endpoint before idle clients are dropped
+    MAX_BUCKETS = 10000
+
+    def __init__(self, app=None):
+        self.rate_limits = {}
+        self.concurrency_limits = {}
+        self.queue_timeout = 0.5
+        self.retry_after = 1
+        self._slots = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._stats = {"admitted": 0, "shed": 0, "limited": 0, "by_endpoint": {}}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        if not app.config.get("ADMISSION_ENABLED", True):
+            return
+        self.rate_limits = app.config.get("RATE_LIMITS", {})
+        self.concurrency_limits = app.config.get("CONCURRENCY_LIMITS", {})
+        self.queue_timeout = app.config.get("ADMISSION_QUEUE_TIMEOUT", 0.5)
+        self.retry_after = app.config.get("ADMISSION_RETRY_AFTER", 1)
+        self._slots = {
+            endpoint: threading.BoundedSemaphore(limit)
+            for endpoint, limit in self.concurrency_limits.items()
+        }
+        app.before_request(self._before)
+        app.teardown_request(self._release)
+
+    def _count(self, endpoint: str, outcome: str) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+            if outcome != "admitted":
+                per_endpoint = self._stats["by_endpoint"].setdefault(endpoint, {"shed": 0, "limited": 0})
+                per_endpoint[outcome] += 1
+
+    def _reject(self, status: int, message: str, retry_after: float):
+        response = jsonify({"error": message})
+        response.status_code = status
+        response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+        return response
+
+    def _rate_limited(self, endpoint: str) -> float:
+        rate, burst = self.rate_limits[endpoint]
+        # remote_addr is the real client when TRUSTED_PROXIES is set (ProxyFix in app.py)
+        client = request.remote_addr or "unknown"
+        with self._lock:
+            buckets = self._buckets.setdefault(endpoint, {})
+            bucket = buckets.get(client)
+            if bucket is None:
+                if len(buckets) >= self.MAX_BUCKETS:
+                    # A full bucket is the same as no bucket, so idle clients can go
+                    idle = [c for c, b in buckets.items() if b.tokens + (time.monotonic() - b.updated) * rate >= burst]
+                    for c in idle or list(buckets)[: len(buckets) // 2]:
+                        del buckets[c]
+                bucket = buckets[client] = TokenBucket(burst)
+            return bucket.take(rate, burst)
+
+    def _before(self):
+        endpoint = request.endpoint
+        # CORS preflights are answered without running the view; counting them
+        # would charge browser clients twice for every request
+        if endpoint is None or request.method == "OPTIONS":
+            return
+
+        if endpoint in self.rate_limits:
+            wait = self._rate_limited(endpoint)
+            if wait:
+                self._count(endpoint, "limited")
+                return self._reject(429, "Too many requests", wait)
+
+        slots = self._slots.get(endpoint)
+        if slots is not None:
+            if not slots.acquire(timeout=self.queue_timeout):
+                self._count(endpoint, "shed")
+                return self._reject(503, "Server busy, please retry", self.retry_after)
+            g.admission_slot = (endpoint, slots)
+            with self._lock:
+                self._in_flight[endpoint] = self._in_flight.get(endpoint, 0) + 1
+        self._count(endpoint, "admitted")
+
+    def _release(self, exc=None) -> None:
+        held = g.pop("admission_slot", None)
+        if held is not None:
+            endpoint, slots = held
+            with self._lock:
+                self._in_flight[endpoint] -= 1
+            slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["by_endpoint"] = {k: dict(v) for k, v in self._stats["by_endpoint"].items()}
+            stats["in_flight"] = dict(self._in_flight)
+        return stats
@@ -0,0 +1,246 @@
+# audit.py
+import atexit
+import glob
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+
+
+# Hold a non-blocking exclusive lock on an open file. The OS drops it when the
+# process exits, however it exits, so a lockable owner file means a dead owner.
+def _try_lock(f) -> bool:
+    try:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.lockf(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+# Buffered, append-only audit trail. Events are appended to a small local
+# write-ahead file, kept in memory, and inserted in multi-row batches when the
+# buffer fills up or the flush interval passes. Each process holds a lock on
+# its own owner file for as long as it runs; write-ahead segments whose owner
+# file can be locked were left by a crashed process and are replayed.
+class AuditLog:
+    def __init__(self, app=None):
+        self.app = None
+        self.enabled = True
+        self.flush_size = 100
+        self.flush_interval = 2.0
+        self.fsync = False
+        self.wal_dir = None
+        self._buffer = []
+        self._wal = None
+        self._segment = 0
+        self._owner = None  # (pid, token, locked owner file) of this process
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._stats = {"recorded": 0, "flushed": 0, "batches": 0, "replayed": 0, "errors": 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.app = app
+        self.enabled = app.config.get("AUDIT_ENABLED", True)
+        self.flush_size = app.config.get("AUDIT_FLUSH_SIZE", 100)
+        self.flush_interval = app.config.get("AUDIT_FLUSH_INTERVAL", 2.0)
+        self.fsync = app.config.get("AUDIT_WAL_FSYNC", False)
+        self.wal_dir = app.config.get("AUDIT_WAL_DIR")
+        if self.enabled and self.wal_dir:
+            os.makedirs(self.wal_dir, exist_ok=True)
+        atexit.register(self.flush)
+
+    # Random per-process token naming this process's files; a PID could be
+    # reused by an unrelated process. Created after any fork.
+    def _token(self) -> str:
+        if self._owner is None or self._owner[0] != os.getpid():
+            token = uuid.uuid4().hex
+            owner = open(os.path.join(self.wal_dir, f"audit-{token}.owner"), "a+")
+            _try_lock(owner)
+            self._owner = (os.getpid(), token, owner)
+            self._segment = 0
+        return self._owner[1]
+
+    def _wal_path(self, suffix: str) -> str:
+        return os.path.join(self.wal_dir, f"audit-{self._token()}{suffix}")
+
+    def _start(self) -> None:
+        # Started lazily so forked workers each get their own flusher thread
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self.replay()
+        except Exception:
+            self._stats["errors"] += 1
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    # Record one event; cheap enough to call inline from request handlers
+    def record(self, action: str, actor_role: str = None, actor_id: int = None,
+               tenant_id: int = None, **details) -> None:
+        if not self.enabled:
+            return
+
+        event = {
+            "event_id": uuid.uuid4().hex,
+            "action": action,
+            "actor_role": actor_role,
+            "actor_id": actor_id,
+            "tenant_id": tenant_id,
+            "details": json.dumps(details, default=str) if details else None,
+            "created_at": datetime.utcnow().isoformat(),
+        }
+
+        with self._lock:
+            if self.wal_dir:
+                if self._wal is None:
+                    self._wal = open(self._wal_path(".wal"), "a")
+                self._wal.write(json.dumps(event) + "\n")
+                self._wal.flush()
+                if self.fsync:
+                    os.fsync(self._wal.fileno())
+            self._buffer.append(event)
+            self._stats["recorded"] += 1
+            full = len(self._buffer) >= self.flush_size
+
+        self._start()
+        if full:
+            self._wake.set()
+
+    # Write buffered events in one multi-row INSERT. The write-ahead file is
+    # rotated together with the buffer and deleted only after the commit.
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                events, self._buffer = self._buffer, []
+                segment = None
+                if self._wal is not None:
+                    self._wal.close()
+                    self._wal = None
+                    self._segment += 1
+                    segment = self._wal_path(f"-{self._segment}.flushing")
+                    os.replace(self._wal_path(".wal"), segment)
+
+            if not events:
+                if segment:
+                    os.remove(segment)
+                return 0
+
+            try:
+                self._insert(events)
+            except Exception:
+                # Keep the segment on disk; it is replayed on the next startup
+                self._stats["errors"] += 1
+                with self._lock:
+                    self._buffer = events + self._buffer
+                return 0
+
+            if segment:
+                os.remove(segment)
+            self._stats["flushed"] += len(events)
+            self._stats["batches"] += 1
+            return len(events)
+
+    # ignore_duplicates skips event_ids already stored (ON CONFLICT DO NOTHING)
+    def _insert(self, events: list, ignore_duplicates: bool = False) -> None:
+        from extensions import db
+        from models.audit import AuditEvent
+
+        rows = [dict(e, created_at=datetime.fromisoformat(e["created_at"])) for e in events]
+        with self.app.app_context():
+            try:
+                stmt = db.insert(AuditEvent)
+                dialect = db.session.get_bind().dialect.name
+                if ignore_duplicates and dialect in ("postgresql", "sqlite"):
+                    if dialect == "postgresql":
+                        from sqlalchemy.dialects.postgresql import insert
+                    else:
+                        from sqlalchemy.dialects.sqlite import insert
+                    stmt = insert(AuditEvent).on_conflict_do_nothing(index_elements=["event_id"])
+                db.session.execute(stmt, rows)
+                db.session.commit()
+            finally:
+                db.session.remove()
+
+    # Insert events from write-ahead segments of processes that are no longer
+    # running. Each segment is claimed by renaming it into this process's
+    # namespace first, so concurrent replayers never pick up the same file and
+    # a replayer that dies mid-way leaves it for the next one. Events that made
+    # it to the database before the crash are skipped.
+    def replay(self) -> int:
+        if not self.enabled or not self.wal_dir:
+            return 0
+
+        token = self._token()
+        replayed = 0
+        for owner_path in glob.glob(os.path.join(self.wal_dir, "audit-*.owner")):
+            dead = os.path.basename(owner_path)[len("audit-"):-len(".owner")]
+            if dead == token:
+                continue
+            try:
+                owner = open(owner_path, "a+")
+            except OSError:
+                continue
+            try:
+                if not _try_lock(owner):
+                    continue  # owner still running
+                for path in sorted(glob.glob(os.path.join(self.wal_dir, f"audit-{dead}[.-]*"))):
+                    if path == owner_path:
+                        continue
+                    with self._lock:
+                        self._segment += 1
+                        claimed = self._wal_path(f"-{self._segment}.replaying")
+                    try:
+                        os.replace(path, claimed)
+                    except OSError:
+                        continue  # claimed by another replayer
+                    replayed += self._replay_segment(claimed)
+            finally:
+                owner.close()
+            try:
+                os.remove(owner_path)
+            except OSError:
+                pass
+
+        self._stats["replayed"] += replayed
+        return replayed
+
+    def _replay_segment(self, path: str) -> int:
+        from extensions import db
+        from models.audit import AuditEvent
+
+        with open(path) as f:
+            events = [json.loads(line) for line in f if line.strip()]
+        missing = []
+        if events:
+            with self.app.app_context():
+                existing = set(db.session.execute(
+                    db.select(AuditEvent.event_id)
+                    .where(AuditEvent.event_id.in_([e["event_id"] for e in events]))
+                ).scalars())
+                db.session.remove()
+            missing = [e for e in events if e["event_id"] not in existing]
+            if missing:
+                self._insert(missing, ignore_duplicates=True)
+        os.remove(path)
+        return len(missing)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, buffered=len(self._buffer))
+
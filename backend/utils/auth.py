@@ -1,33 +1,63 @@
-﻿# auth.py
-from flask import current_app
-from werkzeug.security import generate_password_hash, check_password_hash
-import jwt
-from datetime import datetime, timedelta
-
-# Hash a plain password (used during signup)
-def hash_password(password: str) -> str:
-    return generate_password_hash(password)
-
-# Verify a password against the hash (used during login)
-def verify_password(password: str, hashed: str) -> bool:
-    return check_password_hash(hashed, password)
-
-# Generate a JWT token for a user
-def create_token(user_id: int, role: str, expires_minutes: int = 60) -> str:
-    payload = {
-        "user_id": user_id,
-        "role": role,
-        "exp": datetime.utcnow() + timedelta(minutes=expires_minutes)
-    }
-    token = jwt.encode(payload, current_app.config["SECRET_KEY"], algorithm="HS256")
-    return token
-
-# Decode and verify a JWT token
-def decode_token(token: str) -> dict:
-    try:
-        payload = jwt.decode(token, current_app.config["SECRET_KEY"], algorithms=["HS256"])
-        return payload
-    except jwt.ExpiredSignatureError:
-        raise Exception("Token has expired")
-    except jwt.InvalidTokenError:
-        raise Exception("Invalid token")
+﻿# auth.py
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash
+import jwt
+import uuid
+from datetime import datetime, timedelta
+
+# Raised for missing, expired, invalid or revoked tokens; answered with 401 (see app.py)
+class TokenError(Exception):
+    pass
+
+# Hash a plain password (used during signup)
+def hash_password(password: str) -> str:
+    return generate_password_hash(password)
+
+# Verify a password against the hash (used during login)
+def verify_password(password: str, hashed: str) -> bool:
+    return check_password_hash(hashed, password)
+
+# Generate a JWT token for a user. Every token has its own id (jti) and
+# belongs to a family (fam) shared with the refresh token it was issued with,
+# so logging out can revoke the whole session at once.
+def create_token(user_id: int, role: str, expires_minutes: int = None,
+                 family: str = None, token_type: str = "access") -> str:
+    if expires_minutes is None:
+        expires_minutes = current_app.config.get("ACCESS_TOKEN_MINUTES", 60)
+    payload = {
+        "user_id": user_id,
+        "role": role,
+        "type": token_type,
+        "jti": uuid.uuid4().hex,
+        "fam": family or uuid.uuid4().hex,
+        "exp": datetime.utcnow() + timedelta(minutes=expires_minutes)
+    }
+    token = jwt.encode(payload, current_app.config["SECRET_KEY"], algorithm="HS256")
+    return token
+
+# Generate an access token and a refresh token in the same family
+def create_token_pair(user_id: int, role: str, family: str = None) -> dict:
+    family = family or uuid.uuid4().hex
+    refresh_minutes = current_app.config.get("REFRESH_TOKEN_DAYS", 30) * 24 * 60
+    return {
+        "token": create_token(user_id, role, family=family),
+        "refresh_token": create_token(user_id, role, refresh_minutes, family, "refresh")
+    }
+
+# Decode and verify a JWT token. Revocation is checked in memory (see
+# utils/revocation.py); tokens issued before jti/fam existed are not revocable.
+def decode_token(token: str, token_type: str = "access", check_revoked: bool = True) -> dict:
+    from extensions import revocations
+
+    try:
+        payload = jwt.decode(token, current_app.config["SECRET_KEY"], algorithms=["HS256"])
+    except jwt.ExpiredSignatureError:
+        raise TokenError("Token has expired")
+    except jwt.InvalidTokenError:
+        raise TokenError("Invalid token")
+
+    if payload.get("type", "access") != token_type:
+        raise TokenError("Invalid token")
+    if check_revoked and revocations.is_revoked(payload.get("jti"), payload.get("fam")):
+        raise TokenError("Token has been revoked")
+    return payload
@@ -0,0 +1,152 @@
+# backfill.py
+"""
+Online, chunked data backfills for Alembic revisions.
+
+Rows are visited in primary-key order, one keyset chunk at a time
+(WHERE id > last_id ORDER BY id LIMIT n). Each chunk commits on its own, so
+locks are held only for one chunk. A checkpoint row records progress, which
+lets an interrupted migration resume where it stopped. Inside an Alembic
+autocommit block the chunk and its checkpoint are separate statements, so
+chunk work should be safe to repeat.
+
+Usage inside a revision:
+
+    from utils.backfill import Backfill
+
+    def upgrade():
+        with op.get_context().autocommit_block():
+            Backfill(op.get_bind(), "normalize_room_type", "tenants").update(
+                "room_type = lower(room_type)", where="room_type IS NOT NULL"
+            )
+
+    def downgrade():
+        ...
+        reset(op.get_bind(), "normalize_room_type")
+
+A finished checkpoint makes later runs skip the backfill, so every
+downgrade() that undoes a backfill must reset() it; otherwise upgrading
+again silently does nothing.
+"""
+import time
+from datetime import datetime
+import sqlalchemy as sa
+
+metadata = sa.MetaData()
+
+backfill_checkpoints = sa.Table(
+    "backfill_checkpoints", metadata,
+    sa.Column("name", sa.String(100), primary_key=True),
+    sa.Column("last_key", sa.BigInteger, nullable=False, default=0),
+    sa.Column("rows_done", sa.BigInteger, nullable=False, default=0),
+    sa.Column("started_at", sa.DateTime, nullable=False),
+    sa.Column("updated_at", sa.DateTime, nullable=False),
+    sa.Column("finished_at", sa.DateTime, nullable=True),
+)
+
+
+# Forget a backfill's checkpoint so the next run starts from the beginning
+def reset(connection, name: str) -> None:
+    if not sa.inspect(connection).has_table(backfill_checkpoints.name):
+        return
+    connection.execute(backfill_checkpoints.delete().where(backfill_checkpoints.c.name == name))
+
+
+class Backfill:
+    def __init__(self, connection, name: str, table: str, key: str = "id",
+                 batch_size: int = 1000, throttle_seconds: float = 0.05, log=print):
+        self.connection = connection
+        self.name = name
+        self.table = table
+        self.key = key
+        self.batch_size = batch_size
+        self.throttle_seconds = throttle_seconds
+        self.log = log
+
+    def _checkpoint(self):
+        backfill_checkpoints.create(self.connection, checkfirst=True)
+        row = self.connection.execute(
+            sa.select(backfill_checkpoints).where(backfill_checkpoints.c.name == self.name)
+        ).first()
+        if row is None:
+            now = datetime.utcnow()
+            self.connection.execute(backfill_checkpoints.insert().values(
+                name=self.name, last_key=0, rows_done=0, started_at=now, updated_at=now
+            ))
+            return 0, 0, None
+        return row.last_key, row.rows_done, row.finished_at
+
+    def _save(self, last_key: int, rows_done: int, finished: bool = False) -> None:
+        now = datetime.utcnow()
+        self.connection.execute(
+            backfill_checkpoints.update()
+            .where(backfill_checkpoints.c.name == self.name)
+            .values(last_key=last_key, rows_done=rows_done, updated_at=now,
+                    finished_at=now if finished else None)
+        )
+        self._commit()
+
+    def _commit(self) -> None:
+        # Inside an autocommit block every statement already commits, and the
+        # surrounding (no-op) transaction belongs to Alembic
+        if self.connection.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+            return
+        if self.connection.in_transaction():
+            self.connection.commit()
+
+    # Call process_chunk(connection, first_key, last_key) for each keyset chunk
+    # until the table is exhausted. Returns the number of rows visited.
+    def run(self, process_chunk) -> int:
+        last_key, rows_done, finished_at = self._checkpoint()
+        self._commit()
+        if finished_at is not None:
+            self.log(f"[{self.name}] already finished at {finished_at:%Y-%m-%d %H:%M:%S}, skipping")
+            return rows_done
+
+        remaining = self.connection.execute(sa.text(
+            f"SELECT COUNT(*) FROM {self.table} WHERE {self.key} > :last"
+        ), {"last": last_key}).scalar()
+        total = rows_done + remaining
+        if last_key:
+            self.log(f"[{self.name}] resuming after {self.key}={last_key} ({rows_done}/{total} rows done)")
+
+        started = time.monotonic()
+        done_this_run = 0
+        while True:
+            keys = self.connection.execute(sa.text(
+                f"SELECT {self.key} FROM {self.table} WHERE {self.key} > :last "
+                f"ORDER BY {self.key} LIMIT :n"
+            ), {"last": last_key, "n": self.batch_size}).scalars().all()
+            if not keys:
+                break
+
+            process_chunk(self.connection, keys[0], keys[-1])
+            last_key = keys[-1]
+            rows_done += len(keys)
+            done_this_run += len(keys)
+            self._save(last_key, rows_done)
+
+            elapsed = time.monotonic() - started
+            rate = done_this_run / elapsed if elapsed else 0
+            eta = (total - rows_done) / rate if rate else 0
+            self.log(f"[{self.name}] {rows_done}/{total} rows "
+                     f"({rows_done * 100 // max(total, 1)}%), {rate:.0f} rows/s, ETA {eta:.0f}s")
+
+            # Leave room for regular traffic between chunks
+            if self.throttle_seconds:
+                time.sleep(self.throttle_seconds)
+
+        self._save(last_key, rows_done, finished=True)
+        self.log(f"[{self.name}] finished: {rows_done} rows")
+        return rows_done
+
+    # Common case: run one UPDATE per chunk with the given SET clause
+    def update(self, set_clause: str, where: str = None, params: dict = None) -> int:
+        condition = f" AND ({where})" if where else ""
+
+        def process_chunk(connection, first_key, last_key):
+            connection.execute(sa.text(
+                f"UPDATE {self.table} SET {set_clause} "
+                f"WHERE {self.key} BETWEEN :first_key AND :last_key{condition}"
+            ), dict(params or {}, first_key=first_key, last_key=last_key))
+
+        return self.run(process_chunk)
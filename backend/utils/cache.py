@@ -0,0 +1,195 @@
+# cache.py
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+# In-process LRU store with per-entry expiry
+class LRUBackend:
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    # Invalidation counter, bumped by every invalidate()
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def bump_generation(self) -> None:
+        with self._lock:
+            self._generation += 1
+
+
+# Store backed by any client exposing get/setex/scan_iter/delete/incr
+# (redis.Redis, or a local stand-in in tests), so every worker shares one
+# cache. The invalidation counter is a Redis key too, so an invalidate in
+# one worker stops fills that are in flight in every other worker.
+class RedisBackend:
+    def __init__(self, client, namespace: str = "apartments:cache:"):
+        self.client = client
+        self.namespace = namespace
+        # Outside the namespace so delete_prefix never removes it
+        self.generation_key = namespace.rstrip(":") + "-generation"
+
+    @classmethod
+    def from_url(cls, url: str):
+        import redis
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str):
+        raw = self.client.get(self.namespace + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value, ttl: int) -> None:
+        self.client.setex(self.namespace + key, ttl, json.dumps(value))
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self.client.scan_iter(match=self.namespace + prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.namespace + key)
+
+    def generation(self) -> int:
+        return int(self.client.get(self.generation_key) or 0)
+
+    def bump_generation(self) -> None:
+        self.client.incr(self.generation_key)
+
+
+# Lets concurrent callers asking for the same key share one computation
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    # Returns (result, shared) where shared is True if another caller computed it.
+    # A follower that waits longer than timeout seconds (a stuck leader) stops
+    # waiting and computes the result itself.
+    def do(self, key: str, fn, timeout: float = None):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._calls[key] = call
+
+        if not leader:
+            if not call["done"].wait(timeout):
+                return fn(), False
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"], True
+
+        try:
+            call["result"] = fn()
+            return call["result"], False
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+
+# Response cache for hot GET endpoints: single-flight in front of a pluggable
+# backend, invalidated by prefix from the write paths
+class ResponseCache:
+    def __init__(self, app=None):
+        self.backend = LRUBackend()
+        self.ttl = 5
+        self.enabled = True
+        self.wait_timeout = 10.0
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.enabled = app.config.get("RESPONSE_CACHE_ENABLED", True)
+        self.ttl = app.config.get("RESPONSE_CACHE_TTL", 5)
+        self.wait_timeout = app.config.get("RESPONSE_CACHE_WAIT_TIMEOUT", 10.0)
+        url = app.config.get("RESPONSE_CACHE_URL")
+        if url:
+            self.backend = RedisBackend.from_url(url)
+        else:
+            self.backend = LRUBackend(app.config.get("RESPONSE_CACHE_SIZE", 256))
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    # Return the cached value for key, computing it at most once across
+    # concurrent callers. compute must return JSON-serializable data.
+    def get_or_compute(self, key: str, compute):
+        if not self.enabled:
+            return compute()
+
+        value = self.backend.get(key)
+        if value is not None:
+            self._count("hits")
+            return value
+
+        def fill():
+            generation = self.backend.generation()
+            value = compute()
+            # Skip the store if a write (in any worker) invalidated the cache
+            # while we computed, and undo it if one lands between check and store
+            if generation == self.backend.generation():
+                self.backend.set(key, value, self.ttl)
+                if generation != self.backend.generation():
+                    self.backend.delete(key)
+            return value
+
+        value, shared = self._flight.do(key, fill, self.wait_timeout)
+        self._count("coalesced" if shared else "misses")
+        return value
+
+    # Drop every entry under the given prefixes; call after the write commits
+    def invalidate(self, *prefixes: str) -> None:
+        self.backend.bump_generation()
+        self._count("invalidations")
+        for prefix in prefixes:
+            self.backend.delete_prefix(prefix)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["coalesce_ratio"] = round(stats["coalesced"] / lookups, 3) if lookups else 0.0
+        return stats
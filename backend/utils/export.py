@@ -0,0 +1,135 @@
+# export.py
+import json
+import os
+import pyarrow as pa
+import pyarrow.parquet as pq
+from extensions import db
+from models.payment import Payment
+from models.tenant import Tenant
+from models.house import House
+from models.room_type import RoomType
+
+# Exported tables: model, columns and Arrow types. Passwords never leave the database.
+EXPORT_TABLES = {
+    "payments": (Payment, [
+        ("id", pa.int64()),
+        ("tenant_id", pa.int64()),
+        ("amount", pa.float64()),
+        ("payment_type", pa.string()),
+        ("date_paid", pa.timestamp("us")),
+        ("status", pa.string()),
+    ]),
+    "tenants": (Tenant, [
+        ("id", pa.int64()),
+        ("name", pa.string()),
+        ("email", pa.string()),
+        ("room_type_id", pa.int16()),
+        ("house_id", pa.int64()),
+        ("rent_paid", pa.bool_()),
+        ("water_bill_paid", pa.bool_()),
+        ("electricity_bill_paid", pa.bool_()),
+    ]),
+    "houses": (House, [
+        ("id", pa.int64()),
+        ("number", pa.string()),
+        ("price", pa.float64()),
+        ("type", pa.string()),
+        ("room_type_id", pa.int16()),
+        ("landlord_id", pa.int64()),
+        ("property_id", pa.int64()),
+        ("capacity", pa.int64()),
+        ("occupied", pa.int64()),
+    ]),
+    "room_types": (RoomType, [
+        ("id", pa.int16()),
+        ("name", pa.string()),
+    ]),
+}
+
+# Append-only tables can be pulled incrementally by id. Tenants, houses and room
+# types are updated in place and have no change timestamp, so they are always
+# exported in full.
+INCREMENTAL_TABLES = ("payments",)
+
+FORMATS = ("parquet", "arrow")
+
+
+def _schema(table: str) -> pa.Schema:
+    return pa.schema(EXPORT_TABLES[table][1])
+
+
+def _to_array(values, arrow_type) -> pa.Array:
+    # Numeric columns come back as Decimal
+    if pa.types.is_floating(arrow_type):
+        values = [None if v is None else float(v) for v in values]
+    return pa.array(values, type=arrow_type)
+
+
+# Highest payment id below which every row is committed (or rolled back for
+# good). Ids are drawn from the sequence before commit, so a plain max(id)
+# can pass over rows that commit later with lower ids. On PostgreSQL a brief
+# SHARE lock waits for in-flight inserts to finish before reading max(id);
+# SQLite serializes writers, so max(id) is already safe there.
+def _committed_max_id(model) -> int:
+    if db.session.get_bind().dialect.name == "postgresql":
+        db.session.execute(db.text("SET LOCAL lock_timeout = '10s'"))
+        db.session.execute(db.text(f"LOCK TABLE {model.__tablename__} IN SHARE MODE"))
+    max_id = db.session.execute(db.select(db.func.max(model.id))).scalar()
+    # Release the lock before the (long) export read starts
+    db.session.commit()
+    return max_id or 0
+
+
+# Stream a table to a Parquet or Arrow IPC file, one row group / record batch
+# per chunk, so memory stays bounded by chunk_size. Incremental tables export
+# rows with since_id < id <= a commit-safe watermark (and, for payments,
+# date_paid >= since); the rest are exported in full. Returns the row count
+# and the new id watermark.
+def export_table(table: str, path: str, since_id: int = 0, since=None,
+                 chunk_size: int = 50000, fmt: str = "parquet") -> dict:
+    model, columns = EXPORT_TABLES[table]
+    schema = _schema(table)
+
+    query = db.select(*[getattr(model, name) for name, _ in columns]).order_by(model.id)
+    if table in INCREMENTAL_TABLES:
+        max_id = max(since_id, _committed_max_id(model))
+        query = query.where(model.id > since_id, model.id <= max_id)
+    else:
+        since_id = max_id = 0
+    if since is not None and table == "payments":
+        query = query.where(Payment.date_paid >= since)
+
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(path, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(path, schema)
+
+    rows_written = 0
+    try:
+        # yield_per keeps a server-side cursor open instead of buffering the result
+        result = db.session.execute(query.execution_options(yield_per=chunk_size))
+        for chunk in result.partitions(chunk_size):
+            arrays = [_to_array(values, t) for values, (_, t) in zip(zip(*chunk), columns)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            rows_written += len(chunk)
+            if table not in INCREMENTAL_TABLES:
+                max_id = chunk[-1][0]
+    finally:
+        writer.close()
+
+    return {"table": table, "rows": rows_written, "since_id": since_id, "max_id": max_id, "path": path}
+
+
+def load_watermarks(export_dir: str) -> dict:
+    path = os.path.join(export_dir, "watermarks.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_watermarks(export_dir: str, watermarks: dict) -> None:
+    path = os.path.join(export_dir, "watermarks.json")
+    with open(path + ".tmp", "w") as f:
+        json.dump(watermarks, f, indent=2)
+    os.replace(path + ".tmp", path)
@@ -0,0 +1,133 @@
+# jobs.py
+import json
+import random
+import traceback
+from datetime import datetime, timedelta
+from flask import current_app
+from extensions import db
+from models.job import Job
+
+# name -> callable(payload: dict), filled in by @job_handler
+HANDLERS = {}
+
+
+# Register a function as the handler for a job name
+def job_handler(name: str):
+    def register(fn):
+        HANDLERS[name] = fn
+        return fn
+    return register
+
+
+# Queue a job. It is added to the current session, so it commits (or rolls
+# back) together with the write that triggered it. Caller commits.
+def enqueue(name: str, payload: dict = None, delay_seconds: int = 0, max_attempts: int = None) -> Job:
+    job = Job(
+        name=name,
+        payload=json.dumps(payload or {}),
+        max_attempts=max_attempts or current_app.config.get("JOB_MAX_ATTEMPTS", 5),
+        run_at=datetime.utcnow() + timedelta(seconds=delay_seconds),
+    )
+    db.session.add(job)
+    return job
+
+
+# Atomically take the oldest runnable job, or return None if there is none.
+# PostgreSQL skips rows locked by other workers; elsewhere the conditional
+# UPDATE makes sure only one worker wins a given job.
+def claim_job():
+    now = datetime.utcnow()
+    candidate = db.session.execute(
+        db.select(Job.id)
+        .where(Job.status == "queued", Job.run_at <= now)
+        .order_by(Job.run_at, Job.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    ).scalar()
+    if candidate is None:
+        db.session.commit()
+        return None
+
+    claimed = db.session.execute(
+        db.update(Job)
+        .where(Job.id == candidate, Job.status == "queued")
+        .values(status="running", started_at=now, attempts=Job.attempts + 1)
+    ).rowcount
+    db.session.commit()
+    return db.session.get(Job, candidate) if claimed else None
+
+
+def backoff_seconds(attempts: int) -> float:
+    base = current_app.config.get("JOB_BACKOFF_SECONDS", 5)
+    cap = current_app.config.get("JOB_BACKOFF_MAX_SECONDS", 600)
+    delay = min(cap, base * 2 ** (attempts - 1))
+    # Jitter so jobs that failed together do not retry in lockstep
+    return delay * random.uniform(0.5, 1.0)
+
+
+# Run a claimed job and record the outcome: done, retry later with
+# exponential backoff, or failed once max_attempts is used up
+def run_job(job: Job) -> bool:
+    handler = HANDLERS.get(job.name)
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job '{job.name}'")
+        handler(json.loads(job.payload))
+        job.status = "done"
+        job.finished_at = datetime.utcnow()
+        job.last_error = None
+        db.session.commit()
+        return True
+    except Exception:
+        db.session.rollback()
+        job.last_error = traceback.format_exc(limit=5)
+        if job.attempts >= job.max_attempts:
+            job.status = "failed"
+            job.finished_at = datetime.utcnow()
+        else:
+            job.status = "queued"
+            job.run_at = datetime.utcnow() + timedelta(seconds=backoff_seconds(job.attempts))
+        db.session.commit()
+        return False
+
+
+# Sweep jobs left "running" by a crashed worker: put them back on the queue,
+# or mark them failed if the crashed run used up their last attempt.
+# Returns (requeued, failed).
+def requeue_stale_jobs() -> tuple:
+    timeout = current_app.config.get("JOB_STALE_SECONDS", 300)
+    now = datetime.utcnow()
+    stale = (Job.status == "running", Job.started_at < now - timedelta(seconds=timeout))
+    failed = db.session.execute(
+        db.update(Job)
+        .where(*stale, Job.attempts >= Job.max_attempts)
+        .values(status="failed", finished_at=now,
+                last_error=f"Worker stopped responding after {timeout}s on the last attempt")
+    ).rowcount
+    requeued = db.session.execute(
+        db.update(Job)
+        .where(*stale, Job.attempts < Job.max_attempts)
+        .values(status="queued", run_at=now)
+    ).rowcount
+    db.session.commit()
+    return requeued, failed
+
+
+# Queue depth and lag: how long the oldest runnable job has been waiting
+def queue_metrics() -> dict:
+    now = datetime.utcnow()
+    counts = dict(db.session.execute(
+        db.select(Job.status, db.func.count(Job.id))
+        .where(Job.status.in_(["queued", "running", "failed"]))
+        .group_by(Job.status)
+    ).all())
+    oldest = db.session.execute(
+        db.select(db.func.min(Job.run_at)).where(Job.status == "queued", Job.run_at <= now)
+    ).scalar()
+
+    return {
+        "depth": counts.get("queued", 0),
+        "running": counts.get("running", 0),
+        "failed": counts.get("failed", 0),
+        "lag_seconds": round((now - oldest).total_seconds(), 3) if oldest else 0.0
+    }
@@ -0,0 +1,60 @@
+# moveout.py
+import time
+from extensions import db
+from models.tenant import Tenant
+from models.house import House
+from models.payment import Payment
+from models.messages import Message
+from utils.properties import release_property_units
+
+# Keep IN lists under the bind-parameter limits of every backend we run on
+CHUNK_SIZE = 500
+
+
+# Remove tenants together with their payments and messages using set-based
+# statements, releasing their house units. Everything happens in the caller's
+# transaction; the caller commits (or rolls back on error).
+def move_out_tenants(tenant_ids) -> dict:
+    started = time.perf_counter()
+    ids = sorted(set(int(i) for i in tenant_ids))
+
+    result = {"tenants": 0, "payments": 0, "messages": 0, "houses_released": 0, "tenant_ids": []}
+
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start:start + CHUNK_SIZE]
+
+        # Building counters first, while the tenants still point at their houses
+        release_property_units(chunk)
+
+        # One UPDATE gives back every unit held by the chunk
+        moving = (
+            db.select(db.func.count(Tenant.id))
+            .where(Tenant.house_id == House.id, Tenant.id.in_(chunk))
+            .scalar_subquery()
+        )
+        result["houses_released"] += db.session.execute(
+            db.update(House)
+            .where(House.id.in_(db.select(Tenant.house_id).where(Tenant.id.in_(chunk))))
+            .values(occupied=House.occupied - moving)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+        # Children are deleted explicitly so we can report counts; the ON DELETE
+        # CASCADE foreign keys cover any path that deletes tenants directly
+        result["payments"] += db.session.execute(
+            db.delete(Payment).where(Payment.tenant_id.in_(chunk))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        result["messages"] += db.session.execute(
+            db.delete(Message).where(Message.tenant_id.in_(chunk))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        removed = db.session.execute(
+            db.delete(Tenant).where(Tenant.id.in_(chunk)).returning(Tenant.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        result["tenants"] += len(removed)
+        result["tenant_ids"].extend(removed)
+
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
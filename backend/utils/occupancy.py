@@ -0,0 +1,55 @@
+# occupancy.py
+from extensions import db
+from models.house import House
+from models.tenant import Tenant
+from utils.properties import adjust_property_occupancy
+
+
+class HouseFullError(Exception):
+    pass
+
+
+# Claim a unit in a house for a tenant, releasing any unit they held before.
+# The increment is a conditional UPDATE so two tenants racing for the last
+# unit cannot both succeed. Caller commits.
+def assign_house(tenant: Tenant, house_id: int) -> None:
+    if tenant.house_id == house_id:
+        return
+
+    claimed = db.session.execute(
+        db.update(House)
+        .where(House.id == house_id, House.occupied < House.capacity)
+        .values(occupied=House.occupied + 1)
+    ).rowcount
+    if not claimed:
+        raise HouseFullError(f"House {house_id} has no vacant units")
+    adjust_property_occupancy(house_id, 1)
+
+    release_house(tenant)
+    tenant.house_id = house_id
+
+
+# Give back the unit held by a tenant (move-out or house change). Caller commits.
+def release_house(tenant: Tenant) -> None:
+    if tenant.house_id is None:
+        return
+
+    released = db.session.execute(
+        db.update(House)
+        .where(House.id == tenant.house_id, House.occupied > 0)
+        .values(occupied=House.occupied - 1)
+    ).rowcount
+    if released:
+        adjust_property_occupancy(tenant.house_id, -1)
+    tenant.house_id = None
+
+
+# Rebuild every house's counter from the tenants table in one statement.
+# Used by the seed script and as a repair tool if counters ever drift.
+def recount_occupancy() -> None:
+    occupied = (
+        db.select(db.func.count(Tenant.id))
+        .where(Tenant.house_id == House.id)
+        .scalar_subquery()
+    )
+    db.session.execute(db.update(House).values(occupied=occupied))
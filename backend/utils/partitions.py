@@ -0,0 +1,164 @@
+# partitions.py
+import csv
+import gzip
+import os
+from datetime import date, datetime, timedelta
+from extensions import db
+from models.payment import Payment
+
+ARCHIVE_COLUMNS = ["id", "tenant_id", "amount", "payment_type", "date_paid", "status"]
+
+
+def _is_postgres() -> bool:
+    return db.session.get_bind().dialect.name == "postgresql"
+
+
+def month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def next_month(d: date) -> date:
+    return date(d.year + d.month // 12, d.month % 12 + 1, 1)
+
+
+# First day of the window unfiltered payment queries default to: the
+# current month plus the `months - 1` before it, so only recent partitions are scanned.
+def recent_window_start(months: int) -> date:
+    month = month_start(date.today())
+    for _ in range(months - 1):
+        month = month_start(month - timedelta(days=1))
+    return month
+
+
+def partition_name(month: date) -> str:
+    return f"payments_{month.year}_{month.month:02d}"
+
+
+def archive_path(archive_dir: str, month: date) -> str:
+    return os.path.join(archive_dir, f"{partition_name(month)}.csv.gz")
+
+
+# Create monthly payments partitions from the current month up to
+# months_ahead months out (PostgreSQL only). Safe to run repeatedly.
+# Rows already sitting in payments_default for a new month block
+# CREATE ... PARTITION OF, so a missing partition is built standalone,
+# the month's rows are moved out of the default partition into it, and
+# only then is it attached.
+def ensure_payment_partitions(months_ahead: int = 3) -> list:
+    if not _is_postgres():
+        return []
+
+    created = []
+    month = month_start(date.today())
+    for _ in range(months_ahead + 1):
+        name = partition_name(month)
+        exists = db.session.execute(db.text("SELECT to_regclass(:n)"), {"n": name}).scalar()
+        if not exists:
+            bounds = {"start": month, "end": next_month(month)}
+            # Block inserts into the default partition until the new one is attached
+            db.session.execute(db.text("LOCK TABLE payments_default IN SHARE ROW EXCLUSIVE MODE"))
+            db.session.execute(db.text(
+                f"CREATE TABLE {name} (LIKE payments INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            ))
+            db.session.execute(db.text(
+                f"WITH moved AS ("
+                f"DELETE FROM payments_default WHERE date_paid >= :start AND date_paid < :end "
+                f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+            ), bounds)
+            db.session.execute(db.text(
+                f"ALTER TABLE payments ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month(month).isoformat()}')"
+            ))
+            db.session.commit()
+        created.append(name)
+        month = next_month(month)
+    return created
+
+
+# Move every closed month before `before` out of the hot payments table into
+# gzip-compressed CSV files, one per month. On PostgreSQL the month's
+# partition is dropped; elsewhere the rows are deleted by date range.
+# Only closed months can be archived: a `before` past the current month
+# raises ValueError instead of exporting and deleting live payments.
+def archive_payments(before: date, archive_dir: str) -> list:
+    before = month_start(before)
+    if before > month_start(date.today()):
+        raise ValueError(f"cannot archive {before:%Y-%m} or later: only closed months can be archived")
+    os.makedirs(archive_dir, exist_ok=True)
+
+    oldest = db.session.execute(db.select(db.func.min(Payment.date_paid))).scalar()
+    if oldest is None:
+        return []
+
+    archived = []
+    month = month_start(oldest.date())
+    while month < before:
+        end = next_month(month)
+        rows = db.session.execute(
+            db.select(*[getattr(Payment, c) for c in ARCHIVE_COLUMNS])
+            .where(Payment.date_paid >= month, Payment.date_paid < end)
+            .order_by(Payment.id)
+        ).all()
+
+        if rows:
+            path = archive_path(archive_dir, month)
+            is_new = not os.path.exists(path)
+            # Append so re-archiving a month (e.g. late rows in the default
+            # partition) never overwrites what was archived before
+            with gzip.open(path, "at", newline="") as f:
+                writer = csv.writer(f)
+                if is_new:
+                    writer.writerow(ARCHIVE_COLUMNS)
+                for r in rows:
+                    writer.writerow([r.id, r.tenant_id, r.amount, r.payment_type,
+                                     r.date_paid.isoformat(), r.status])
+
+        if _is_postgres():
+            name = partition_name(month)
+            exists = db.session.execute(db.text("SELECT to_regclass(:n)"), {"n": name}).scalar()
+            if exists:
+                db.session.execute(db.text(f"ALTER TABLE payments DETACH PARTITION {name}"))
+                db.session.execute(db.text(f"DROP TABLE {name}"))
+        db.session.execute(
+            db.delete(Payment)
+            .where(Payment.date_paid >= month, Payment.date_paid < end)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+        if rows:
+            archived.append({"month": month.strftime("%Y-%m"), "rows": len(rows)})
+        month = end
+
+    return archived
+
+
+# Read one archived month back, optionally for a single tenant.
+def read_archived_payments(archive_dir: str, month: date, tenant_id: int = None) -> list:
+    path = archive_path(archive_dir, month_start(month))
+    if not os.path.exists(path):
+        return []
+
+    payments = []
+    seen = set()
+    with gzip.open(path, "rt", newline="") as f:
+        for row in csv.DictReader(f):
+            # A run interrupted after writing but before deleting re-archives rows
+            if row["id"] in seen:
+                continue
+            seen.add(row["id"])
+            if tenant_id is not None and int(row["tenant_id"]) != tenant_id:
+                continue
+            payments.append({
+                "id": int(row["id"]),
+                "tenant_id": int(row["tenant_id"]),
+                "amount": float(row["amount"]),
+                "payment_type": row["payment_type"],
+                "status": row["status"],
+                "date_paid": row["date_paid"]
+            })
+    return payments
+
+
+def parse_month(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m").date()
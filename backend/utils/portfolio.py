@@ -0,0 +1,218 @@
+# portfolio.py
+"""
+Columnar, in-memory snapshot of tenant state for what-if pricing simulations.
+
+One row per tenant, stored as parallel NumPy arrays: room type id (0 when no
+room is selected), house id and the three paid flags. The snapshot is loaded once, then kept current by the
+write paths (signup, room selection, payments, move-out) calling upsert() and
+remove() after they commit. Every worker process holds its own copy, so it is
+also rebuilt from the database once it is older than PORTFOLIO_SNAPSHOT_MAX_AGE.
+
+Benchmark on synthetic data (run from backend directory):
+    python -m utils.portfolio --tenants 100000 --scenarios 1000
+"""
+import argparse
+import threading
+import time
+import numpy as np
+
+BILL_TYPES = ["rent", "water", "electricity"]
+
+
+class PortfolioSnapshot:
+    def __init__(self, app=None):
+        self.max_age = 300
+        self.loaded_at = None
+        self._lock = threading.Lock()
+        self._reset(0)
+        self._stats = {"loads": 0, "upserts": 0, "removals": 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.max_age = app.config.get("PORTFOLIO_SNAPSHOT_MAX_AGE", 300)
+
+    def _reset(self, capacity: int) -> None:
+        self.size = 0
+        self._rows = {}  # tenant id -> row
+        self.tenant_id = np.zeros(capacity, dtype=np.int64)
+        self.room_code = np.zeros(capacity, dtype=np.int16)
+        self.house_id = np.zeros(capacity, dtype=np.int64)
+        self.paid = np.zeros((len(BILL_TYPES), capacity), dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def _grow(self) -> None:
+        capacity = max(1024, len(self.tenant_id) * 2)
+        for name in ("tenant_id", "room_code", "house_id", "alive"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+        paid = np.zeros((len(BILL_TYPES), capacity), dtype=bool)
+        paid[:, :self.paid.shape[1]] = self.paid
+        self.paid = paid
+
+    def _set_row(self, row: int, tenant_id, room_type_id, house_id, rent_paid, water_paid, electricity_paid) -> None:
+        self.tenant_id[row] = tenant_id
+        self.room_code[row] = room_type_id or 0
+        self.house_id[row] = house_id or 0
+        self.paid[:, row] = (bool(rent_paid), bool(water_paid), bool(electricity_paid))
+        self.alive[row] = True
+
+    # Rebuild from the database in one query
+    def load(self) -> None:
+        from extensions import db
+        from models.tenant import Tenant
+
+        rows = db.session.execute(
+            db.select(Tenant.id, Tenant.room_type_id, Tenant.house_id,
+                      Tenant.rent_paid, Tenant.water_bill_paid, Tenant.electricity_bill_paid)
+            .order_by(Tenant.id)
+        ).all()
+
+        with self._lock:
+            self._reset(max(1024, len(rows)))
+            for row, values in enumerate(rows):
+                self._set_row(row, *values)
+                self._rows[values[0]] = row
+            self.size = len(rows)
+            self.loaded_at = time.monotonic()
+            self._stats["loads"] += 1
+
+    def ensure_loaded(self) -> None:
+        if self.loaded_at is None or time.monotonic() - self.loaded_at > self.max_age:
+            self.load()
+
+    # Apply one tenant's committed state; a no-op until the snapshot is loaded
+    def upsert(self, tenant) -> None:
+        with self._lock:
+            if self.loaded_at is None:
+                return
+            row = self._rows.get(tenant.id)
+            if row is None:
+                if self.size == len(self.tenant_id):
+                    self._grow()
+                row = self._rows[tenant.id] = self.size
+                self.size += 1
+            self._set_row(row, tenant.id, tenant.room_type_id, tenant.house_id,
+                          tenant.rent_paid, tenant.water_bill_paid, tenant.electricity_bill_paid)
+            self._stats["upserts"] += 1
+
+    # Drop moved-out tenants. Rows are tombstoned, not compacted; the next
+    # reload reclaims the space.
+    def remove(self, tenant_ids) -> None:
+        with self._lock:
+            if self.loaded_at is None:
+                return
+            for tenant_id in tenant_ids:
+                row = self._rows.pop(tenant_id, None)
+                if row is not None:
+                    self.alive[row] = False
+                    self._stats["removals"] += 1
+
+    # Bulk writes that bypass upsert() (e.g. statement reconciliation) make the
+    # next read reload from the database
+    def expire(self) -> None:
+        with self._lock:
+            self.loaded_at = None
+
+    # Copy of the live rows, so simulations run without holding the lock
+    def frame(self, house_ids=None) -> dict:
+        from extensions import room_types
+
+        self.ensure_loaded()
+        with self._lock:
+            mask = self.alive[:self.size].copy()
+            # An empty list selects no houses, not all of them
+            if house_ids is not None:
+                mask &= np.isin(self.house_id[:self.size], np.array(list(house_ids), dtype=np.int64))
+            frame = {
+                "room_code": self.room_code[:self.size][mask],
+                "house_id": self.house_id[:self.size][mask],
+                "paid": self.paid[:, :self.size][:, mask],
+            }
+        # Names indexed by room type id, for mapping prices onto codes
+        top = int(frame["room_code"].max()) if len(frame["room_code"]) else 0
+        frame["room_types"] = [None] + [room_types.name_for(i) for i in range(1, top + 1)]
+        return frame
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, tenants=len(self._rows), rows=self.size,
+                        age_seconds=round(time.monotonic() - self.loaded_at, 1) if self.loaded_at else None)
+
+
+# Evaluate every pricing scenario in one pass. Each scenario may override
+# rent_prices and utility_bills; anything it leaves out keeps the current price.
+# Tenants are reduced to per-room-type counts first, so the cost per scenario
+# is independent of the number of tenants.
+def simulate(frame: dict, scenarios: list, rent_prices: dict, utility_bills: dict) -> list:
+    room_types = frame["room_types"]
+    k = len(room_types)
+    codes = frame["room_code"].astype(np.int64)
+    tenants = len(codes)
+
+    occupied = np.bincount(codes, minlength=k)
+    occupied[0] = 0  # tenants without a room owe no rent
+    rent_paid = np.bincount(codes, weights=frame["paid"][0], minlength=k).astype(np.int64)
+    rent_paid[0] = 0
+    utilities_paid = frame["paid"][1:].sum(axis=1)
+
+    rent = np.array([
+        [scenario.get("rent_prices", {}).get(t, rent_prices.get(t, 0)) for t in room_types]
+        for scenario in scenarios
+    ], dtype=np.float64).reshape(len(scenarios), k)
+    utilities = np.array([
+        [scenario.get("utility_bills", {}).get(b, utility_bills[b]) for b in BILL_TYPES[1:]]
+        for scenario in scenarios
+    ], dtype=np.float64).reshape(len(scenarios), 2)
+
+    rent_expected = rent * occupied
+    expected = rent_expected.sum(axis=1) + utilities.sum(axis=1) * tenants
+    collected = rent @ rent_paid + utilities @ utilities_paid
+    rate = np.divide(collected, expected, out=np.zeros_like(expected), where=expected > 0)
+
+    present = [i for i in range(1, k) if occupied[i]]
+    return [
+        {
+            "name": scenario.get("name", f"scenario_{i + 1}"),
+            "expected_revenue": int(expected[i]),
+            "collected_revenue": int(collected[i]),
+            "outstanding": int(expected[i] - collected[i]),
+            "collection_rate": round(float(rate[i]) * 100, 2),
+            "rent_by_room_type": {room_types[j]: int(rent_expected[i, j]) for j in present},
+        }
+        for i, scenario in enumerate(scenarios)
+    ]
+
+
+def benchmark(tenants: int, scenarios: int) -> None:
+    rng = np.random.default_rng(0)
+    types = ["Bedsitter", "1-Bedroom", "2-Bedroom", "Studio", "3-Bedroom"]
+    prices = {"Bedsitter": 5000, "1-Bedroom": 8000, "2-Bedroom": 12000, "Studio": 6000, "3-Bedroom": 15000}
+    frame = {
+        "room_types": [None] + types,
+        "room_code": rng.integers(0, len(types) + 1, tenants).astype(np.int16),
+        "house_id": rng.integers(1, tenants // 4 + 2, tenants),
+        "paid": rng.random((len(BILL_TYPES), tenants)) < 0.6,
+    }
+    grid = [
+        {"name": f"2br_{price}", "rent_prices": {"2-Bedroom": int(price)}}
+        for price in np.linspace(10000, 16000, scenarios)
+    ]
+
+    started = time.perf_counter()
+    results = simulate(frame, grid, prices, {"water": 800, "electricity": 1200})
+    done = time.perf_counter()
+
+    print(f"tenants={tenants} scenarios={scenarios}")
+    print(f"   - simulation: {(done - started) * 1000:.1f} ms")
+    print(f"   - first: {results[0]['expected_revenue']}, last: {results[-1]['expected_revenue']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the pricing simulation")
+    parser.add_argument("--tenants", type=int, default=100_000)
+    parser.add_argument("--scenarios", type=int, default=1000)
+    args = parser.parse_args()
+    benchmark(args.tenants, args.scenarios)
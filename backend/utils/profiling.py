@@ -0,0 +1,132 @@
+# profiling.py
+import cProfile
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# Opt-in request profiling. A request is profiled when it is picked by
+# PROFILE_SAMPLE_RATE or when a landlord sends the PROFILE_HEADER header.
+# Each profile is written as a cProfile/pstats .prof file (open with
+# snakeviz, pstats or gprof2dot) next to a .sql.json file with per-statement
+# timings. Unprofiled requests pay for one header lookup and one random().
+class RequestProfiler:
+    def __init__(self, app=None):
+        self.sample_rate = 0.0
+        self.header = "X-Profile"
+        self.profile_dir = None
+        self._sql_hooked = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {"profiled": 0, "sampled": 0, "requested": 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.sample_rate = app.config.get("PROFILE_SAMPLE_RATE", 0.0)
+        self.header = app.config.get("PROFILE_HEADER", "X-Profile")
+        self.profile_dir = app.config.get("PROFILE_DIR")
+        if not app.config.get("PROFILE_ENABLED", True) or not self.profile_dir:
+            return
+        app.before_request(self._before)
+        app.after_request(self._after)
+        app.teardown_request(self._teardown)
+
+    def _requested_by_landlord(self) -> bool:
+        from utils.auth import decode_token
+
+        auth = request.headers.get("Authorization", "")
+        try:
+            payload = decode_token(auth.split(" ")[1])
+        except Exception:
+            return False
+        return payload.get("role") == "landlord"
+
+    def _before(self):
+        requested = self.header in request.headers
+        sampled = not requested and self.sample_rate > 0 and random.random() < self.sample_rate
+        if not requested and not sampled:
+            return
+        if requested and not self._requested_by_landlord():
+            return
+
+        self._hook_sql()
+        self._local.queries = []
+        g.profile = cProfile.Profile()
+        g.profile_reason = "header" if requested else "sampled"
+        g.profile_started = time.perf_counter()
+        g.profile.enable()
+
+    def _after(self, response):
+        profile = g.pop("profile", None)
+        if profile is None:
+            return response
+        profile.disable()
+        elapsed_ms = (time.perf_counter() - g.profile_started) * 1000
+
+        queries = self._local.queries
+        self._local.queries = None
+
+        profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        os.makedirs(self.profile_dir, exist_ok=True)
+        base = os.path.join(self.profile_dir, profile_id)
+        profile.dump_stats(base + ".prof")
+        with open(base + ".sql.json", "w") as f:
+            json.dump({
+                "method": request.method,
+                "path": request.full_path,
+                "endpoint": request.endpoint,
+                "status": response.status_code,
+                "reason": g.profile_reason,
+                "elapsed_ms": round(elapsed_ms, 3),
+                "sql_ms": round(sum(q["duration_ms"] for q in queries), 3),
+                "queries": queries,
+            }, f, indent=2)
+
+        with self._lock:
+            self._stats["profiled"] += 1
+            self._stats["requested" if g.profile_reason == "header" else "sampled"] += 1
+        response.headers["X-Profile-Id"] = profile_id
+        return response
+
+    def _teardown(self, exc=None) -> None:
+        # Unhandled errors skip after_request; make sure profiling stops anyway
+        profile = g.pop("profile", None)
+        if profile is not None:
+            profile.disable()
+            self._local.queries = None
+
+    # Statement timing listeners are installed on the first profiled request
+    # and record nothing unless the current thread is being profiled
+    def _hook_sql(self) -> None:
+        with self._lock:
+            if self._sql_hooked:
+                return
+            self._sql_hooked = True
+
+        local = self._local
+
+        @event.listens_for(Engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if getattr(local, "queries", None) is not None:
+                conn.info.setdefault("profile_start", []).append(time.perf_counter())
+
+        @event.listens_for(Engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if getattr(local, "queries", None) is not None and conn.info.get("profile_start"):
+                started = conn.info["profile_start"].pop()
+                local.queries.append({
+                    "statement": statement,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                    "executemany": executemany,
+                })
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, sample_rate=self.sample_rate)
@@ -0,0 +1,156 @@
+# properties.py
+from datetime import datetime
+from decimal import Decimal
+from extensions import db
+from models.property import Property
+from models.house import House
+from models.tenant import Tenant
+from models.payment import Payment
+
+# Keep IN lists under the bind-parameter limits of every backend we run on
+CHUNK_SIZE = 500
+
+
+# Collection period the `collected` counter belongs to
+def current_period(now: datetime = None) -> str:
+    return (now or datetime.utcnow()).strftime("%Y-%m")
+
+
+# What a property row reads as right now: `collected` from an earlier period is 0
+def collected_this_period(prop: Property) -> Decimal:
+    return prop.collected if prop.period == current_period() else Decimal(0)
+
+
+# A unit in house_id was taken (delta=1) or given back (delta=-1): move the
+# building's occupied and expected-rent counters in one UPDATE. Caller commits.
+def adjust_property_occupancy(house_id: int, delta: int) -> None:
+    property_id = db.select(House.property_id).where(House.id == house_id).scalar_subquery()
+    price = db.select(House.price).where(House.id == house_id).scalar_subquery()
+    db.session.execute(
+        db.update(Property)
+        .where(Property.id == property_id)
+        .values(occupied=Property.occupied + delta,
+                expected_rent=Property.expected_rent + delta * price)
+        .execution_options(synchronize_session=False)
+    )
+
+
+# Tenants in tenant_ids are moving out: take their units, and this period's
+# payments that are deleted with them, off their buildings' counters with one
+# set-based UPDATE. Must run before the tenants and payments are deleted.
+def release_property_units(tenant_ids: list) -> None:
+    period = current_period()
+    occupied = (
+        db.select(db.func.count(Tenant.id))
+        .join(House, House.id == Tenant.house_id)
+        .where(Tenant.id.in_(tenant_ids), House.property_id == Property.id)
+        .scalar_subquery()
+    )
+    rent = (
+        db.select(db.func.coalesce(db.func.sum(House.price), 0))
+        .join(Tenant, Tenant.house_id == House.id)
+        .where(Tenant.id.in_(tenant_ids), House.property_id == Property.id)
+        .scalar_subquery()
+    )
+    paid = (
+        db.select(db.func.coalesce(db.func.sum(Payment.amount), 0))
+        .join(Tenant, Tenant.id == Payment.tenant_id)
+        .join(House, House.id == Tenant.house_id)
+        .where(Tenant.id.in_(tenant_ids), House.property_id == Property.id,
+               Payment.date_paid >= datetime.strptime(period, "%Y-%m"))
+        .scalar_subquery()
+    )
+    db.session.execute(
+        db.update(Property)
+        .where(Property.id.in_(
+            db.select(House.property_id).join(Tenant, Tenant.house_id == House.id).where(Tenant.id.in_(tenant_ids))
+        ))
+        .values(occupied=Property.occupied - occupied, expected_rent=Property.expected_rent - rent,
+                collected=db.case((Property.period == period, Property.collected - paid), else_=0),
+                period=period)
+        .execution_options(synchronize_session=False)
+    )
+
+
+# Add received payments (dicts with tenant_id, amount and date_paid) to their
+# buildings' collected counters, starting a new period where the stored one is
+# stale. Payments dated in an earlier period (e.g. back-dated statement lines)
+# are skipped: `collected` only ever holds the current period. One SELECT per
+# chunk to find the buildings, one executemany UPDATE. Caller commits.
+def record_collections(payments: list) -> None:
+    period = current_period()
+    amounts = {}
+    for payment in payments:
+        if current_period(payment["date_paid"]) != period:
+            continue
+        tenant_id = payment["tenant_id"]
+        amounts[tenant_id] = amounts.get(tenant_id, 0) + Decimal(str(payment["amount"]))
+    if not amounts:
+        return
+
+    per_property = {}
+    tenant_ids = list(amounts)
+    for start in range(0, len(tenant_ids), CHUNK_SIZE):
+        chunk = tenant_ids[start:start + CHUNK_SIZE]
+        rows = db.session.execute(
+            db.select(Tenant.id, House.property_id)
+            .join(House, House.id == Tenant.house_id)
+            .where(Tenant.id.in_(chunk), House.property_id.isnot(None))
+        ).all()
+        for tenant_id, property_id in rows:
+            per_property[property_id] = per_property.get(property_id, 0) + amounts[tenant_id]
+    if not per_property:
+        return
+
+    stmt = (
+        db.update(Property.__table__)
+        .where(Property.__table__.c.id == db.bindparam("property_id"))
+        .values(
+            collected=db.case(
+                (Property.__table__.c.period == period, Property.__table__.c.collected + db.bindparam("amount")),
+                else_=db.bindparam("amount")
+            ),
+            period=period
+        )
+    )
+    db.session.execute(stmt, [{"property_id": p, "amount": a} for p, a in per_property.items()])
+
+
+# Rebuild counters from houses, tenants and this period's payments with
+# set-based statements. Used by the seed script, after houses are attached to
+# a property, and as a repair tool. Payments count toward the building the
+# tenant lives in now.
+def recount_properties(property_ids: list = None) -> None:
+    period = current_period()
+    period_start = datetime.strptime(period, "%Y-%m")
+
+    units = (
+        db.select(db.func.coalesce(db.func.sum(House.capacity), 0))
+        .where(House.property_id == Property.id)
+        .scalar_subquery()
+    )
+    occupied = (
+        db.select(db.func.count(Tenant.id))
+        .join(House, House.id == Tenant.house_id)
+        .where(House.property_id == Property.id)
+        .scalar_subquery()
+    )
+    rent = (
+        db.select(db.func.coalesce(db.func.sum(House.price), 0))
+        .join(Tenant, Tenant.house_id == House.id)
+        .where(House.property_id == Property.id)
+        .scalar_subquery()
+    )
+    collected = (
+        db.select(db.func.coalesce(db.func.sum(Payment.amount), 0))
+        .join(Tenant, Tenant.id == Payment.tenant_id)
+        .join(House, House.id == Tenant.house_id)
+        .where(House.property_id == Property.id, Payment.date_paid >= period_start)
+        .scalar_subquery()
+    )
+
+    stmt = db.update(Property).values(units=units, occupied=occupied, expected_rent=rent,
+                                      collected=collected, period=period)
+    if property_ids is not None:
+        stmt = stmt.where(Property.id.in_(property_ids))
+    db.session.execute(stmt.execution_options(synchronize_session=False))
@@ -0,0 +1,387 @@
+# reconcile.py
+"""
+Bank-statement reconciliation: match incoming credits to tenants and the bills
+they settle, then record them as Payment rows.
+
+Each statement line is tried against hash indexes in order of confidence:
+    1. reference   - a tenant reference such as "T123" / "T-123" (tenant id)
+    2. email       - an email address in any column
+    3. name        - exact match on the normalized payer name ("DOE JOHN" == "John Doe")
+    4. fuzzy       - difflib similarity, only against tenants sharing two name
+                     tokens (or, failing that, the rarest single token)
+Name matches that hit several tenants are narrowed by amount: the amount must
+equal one unpaid bill or a combination of unpaid bills of exactly one of them.
+Every line costs a few dict lookups, plus one small candidate block for fuzzy
+matches, so a statement is matched in near-linear time.
+
+Benchmark on synthetic data (run from backend directory):
+    python -m utils.reconcile --tenants 100000 --lines 100000
+"""
+import argparse
+import csv
+import difflib
+import io
+import re
+import time
+import unicodedata
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from itertools import combinations
+
+BILL_TYPES = ["rent", "water", "electricity"]
+
+# Minimum difflib ratio for a fuzzy name match, and how far ahead of the
+# runner-up the best candidate has to be
+FUZZY_THRESHOLD = 0.85
+FUZZY_MARGIN = 0.05
+# Largest candidate block scored for one line
+FUZZY_BLOCK_LIMIT = 500
+
+REFERENCE_PATTERN = re.compile(r"\bT-?0*(\d+)\b", re.IGNORECASE)
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+# Accepted header spellings for each statement column
+COLUMNS = {
+    "date": ("date", "value_date", "transaction_date", "posted"),
+    "reference": ("reference", "ref", "narrative", "description", "details"),
+    "payer": ("payer", "name", "payer_name", "sender"),
+    "email": ("email", "payer_email"),
+    "amount": ("amount", "credit", "paid_in"),
+}
+
+
+def normalize_name(name: str) -> str:
+    if not name:
+        return ""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    return " ".join(sorted(re.findall(r"[a-z]+", name.lower())))
+
+
+def to_cents(amount) -> int:
+    return int((Decimal(str(amount)) * 100).to_integral_value())
+
+
+# Parse a CSV statement into line dicts. Debits, blank and unparseable amounts
+# are skipped and counted.
+def read_statement(text: str):
+    reader = csv.DictReader(io.StringIO(text))
+    headers = {h.strip().lower(): h for h in reader.fieldnames or []}
+    source = {
+        column: next((headers[a] for a in aliases if a in headers), None)
+        for column, aliases in COLUMNS.items()
+    }
+    if source["amount"] is None:
+        raise ValueError("Statement needs an amount column")
+
+    lines, skipped = [], 0
+    for number, row in enumerate(reader, start=2):
+        line = {column: (row.get(header) or "").strip() if header else "" for column, header in source.items()}
+        try:
+            cents = to_cents(line["amount"].replace(",", ""))
+        except (InvalidOperation, ValueError):
+            skipped += 1
+            continue
+        if cents <= 0:
+            skipped += 1
+            continue
+        line["line"] = number
+        line["cents"] = cents
+        lines.append(line)
+    return lines, skipped
+
+
+class Matcher:
+    # tenants: iterable of (id, name, email, room_type name, rent_paid, water_paid, electricity_paid)
+    def __init__(self, tenants, rent_prices: dict, utility_bills: dict):
+        self.names = {}
+        self.unpaid = {}
+        self.by_id = set()
+        self.by_email = {}
+        self.by_name = {}
+        self.by_token = {}
+        self.by_pair = {}
+        self.stats = {"lines": 0, "matched": 0, "reference": 0, "email": 0, "name": 0, "fuzzy": 0,
+                      "no_tenant": 0, "ambiguous": 0, "amount_mismatch": 0, "already_paid": 0}
+
+        for tenant_id, name, email, room_type, *paid in tenants:
+            prices = [rent_prices.get(room_type, 0), utility_bills["water"], utility_bills["electricity"]]
+            self.unpaid[tenant_id] = {
+                bill: to_cents(price)
+                for bill, price, is_paid in zip(BILL_TYPES, prices, paid)
+                if not is_paid and price
+            }
+            self.by_id.add(tenant_id)
+            if email:
+                self.by_email[email.lower()] = tenant_id
+            normalized = self.names[tenant_id] = normalize_name(name)
+            self.by_name.setdefault(normalized, []).append(tenant_id)
+            tokens = sorted(set(normalized.split()))
+            for token in tokens:
+                self.by_token.setdefault(token, []).append(tenant_id)
+            for pair in combinations(tokens, 2):
+                self.by_pair.setdefault(pair, []).append(tenant_id)
+
+    # Which unpaid bills an amount settles: a single bill, or the smallest
+    # combination of bills adding up to it exactly
+    def allocate(self, tenant_id: int, cents: int):
+        unpaid = self.unpaid.get(tenant_id, {})
+        for size in range(1, len(unpaid) + 1):
+            for bills in combinations(unpaid, size):
+                if sum(unpaid[b] for b in bills) == cents:
+                    return bills
+        return None
+
+    def _by_amount(self, candidates, cents: int) -> list:
+        return [c for c in candidates if self.allocate(c, cents) is not None]
+
+    # Candidate block: tenants sharing any two tokens with the payer name. A
+    # misspelt token leaves the other pairs intact; when no pair survives
+    # (e.g. two-word names) fall back to the rarest shared token.
+    def _block(self, normalized: str) -> list:
+        tokens = sorted(set(normalized.split()))
+        block = set()
+        for pair in combinations(tokens, 2):
+            block.update(self.by_pair.get(pair, ()))
+        if block:
+            return list(block)[:FUZZY_BLOCK_LIMIT]
+        singles = [self.by_token[t] for t in tokens if t in self.by_token]
+        return min(singles, key=len)[:FUZZY_BLOCK_LIMIT] if singles else []
+
+    def _fuzzy(self, normalized: str, cents: int):
+        block = self._block(normalized)
+        if not block:
+            return None, "no_tenant"
+        # Prefer tenants who can actually owe this amount
+        candidates = self._by_amount(block, cents) or block
+
+        # difflib caches details about the second sequence, so the payer goes there
+        matcher = difflib.SequenceMatcher(None, "", normalized)
+        scored = []
+        for candidate in candidates:
+            matcher.set_seq1(self.names[candidate])
+            if matcher.real_quick_ratio() >= FUZZY_THRESHOLD and matcher.quick_ratio() >= FUZZY_THRESHOLD:
+                scored.append((matcher.ratio(), candidate))
+        scored.sort(reverse=True)
+
+        if not scored or scored[0][0] < FUZZY_THRESHOLD:
+            return None, "no_tenant"
+        if len(scored) > 1 and scored[0][0] - scored[1][0] < FUZZY_MARGIN:
+            return None, "ambiguous"
+        return scored[0][1], "fuzzy"
+
+    def find_tenant(self, line: dict):
+        text = " ".join((line["reference"], line["payer"], line["email"]))
+
+        for match in REFERENCE_PATTERN.finditer(line["reference"]):
+            if int(match.group(1)) in self.by_id:
+                return int(match.group(1)), "reference"
+
+        for email in EMAIL_PATTERN.findall(text):
+            if email.lower() in self.by_email:
+                return self.by_email[email.lower()], "email"
+
+        normalized = normalize_name(line["payer"])
+        if not normalized:
+            return None, "no_tenant"
+        exact = self.by_name.get(normalized)
+        if exact:
+            if len(exact) == 1:
+                return exact[0], "name"
+            owing = self._by_amount(exact, line["cents"])
+            if len(owing) == 1:
+                return owing[0], "name"
+            return None, "ambiguous"
+
+        return self._fuzzy(normalized, line["cents"])
+
+    # Match one line. Returns (tenant_id, method, {bill: cents}); tenant_id is
+    # None and method holds the reason when the line cannot be applied.
+    def match(self, line: dict):
+        self.stats["lines"] += 1
+        tenant_id, method = self.find_tenant(line)
+        if tenant_id is None:
+            self.stats[method] += 1
+            return None, method, {}
+
+        bills = self.allocate(tenant_id, line["cents"])
+        if bills is None:
+            self.stats["amount_mismatch"] += 1
+            return None, "amount_mismatch", {}
+
+        # Settled bills are no longer outstanding for later lines
+        settled = {bill: self.unpaid[tenant_id].pop(bill) for bill in bills}
+        self.stats["matched"] += 1
+        self.stats[method] += 1
+        return tenant_id, method, settled
+
+
+def parse_date(value: str):
+    for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%d/%m/%Y", "%d-%m-%Y"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+# Match a parsed statement against current tenants and write the results:
+# one Payment per settled bill (multi-row INSERT), the tenants' paid flags
+# (executemany UPDATE) and the buildings' collected counters. Matched tenants
+# are locked and re-checked before writing; lines whose bills were paid in the
+# meantime are reported as already_paid. Runs in the caller's transaction;
+# the caller commits.
+def reconcile_statement(lines: list, rent_prices: dict, utility_bills: dict,
+                        dry_run: bool = False, chunk_size: int = 5000) -> dict:
+    from extensions import db, room_types
+    from models.tenant import Tenant
+    from models.payment import Payment
+    from utils.properties import record_collections
+
+    started = time.perf_counter()
+    tenants = db.session.execute(
+        db.select(Tenant.id, Tenant.name, Tenant.email, Tenant.room_type_id,
+                  Tenant.rent_paid, Tenant.water_bill_paid, Tenant.electricity_bill_paid)
+    ).all()
+    tenants = [(t[0], t[1], t[2], room_types.name_for(t[3]), *t[4:]) for t in tenants]
+    matcher = Matcher(tenants, rent_prices, utility_bills)
+    indexed = time.perf_counter()
+
+    now = datetime.utcnow()
+    applied, unmatched = [], []
+    for line in lines:
+        tenant_id, method, bills = matcher.match(line)
+        if tenant_id is None:
+            unmatched.append({"line": line["line"], "reason": method, "payer": line["payer"],
+                              "reference": line["reference"], "amount": line["cents"] / 100})
+            continue
+        applied.append((line, tenant_id, method, bills))
+    matched = time.perf_counter()
+
+    columns = {"rent": "rent_paid", "water": "water_bill_paid", "electricity": "electricity_bill_paid"}
+    if not dry_run:
+        # Lock the matched tenants (in id order, so concurrent runs can't
+        # deadlock) and re-read their flags: a bill paid through pay_bill
+        # since the snapshot above must not be recorded a second time
+        matched_ids = sorted({tenant_id for _, tenant_id, _, _ in applied})
+        paid_now = {}
+        for start in range(0, len(matched_ids), chunk_size):
+            for row in db.session.execute(
+                db.select(Tenant.id, *[getattr(Tenant, c) for c in columns.values()])
+                .where(Tenant.id.in_(matched_ids[start:start + chunk_size]))
+                .order_by(Tenant.id)
+                .with_for_update()
+            ):
+                paid_now[row[0]] = {bill for bill, is_paid in zip(columns, row[1:]) if is_paid}
+        fresh = []
+        for line, tenant_id, method, bills in applied:
+            if paid_now.get(tenant_id, set()).isdisjoint(bills):
+                fresh.append((line, tenant_id, method, bills))
+                continue
+            matcher.stats["matched"] -= 1
+            matcher.stats[method] -= 1
+            matcher.stats["already_paid"] += 1
+            unmatched.append({"line": line["line"], "reason": "already_paid", "payer": line["payer"],
+                              "reference": line["reference"], "amount": line["cents"] / 100})
+        applied = fresh
+
+    payments, paid_flags = [], {}
+    for line, tenant_id, _, bills in applied:
+        date_paid = parse_date(line["date"]) or now
+        for bill, cents in bills.items():
+            payments.append({"tenant_id": tenant_id, "amount": Decimal(cents) / 100, "payment_type": bill,
+                             "status": "completed", "date_paid": date_paid})
+        paid_flags.setdefault(tenant_id, set()).update(bills)
+
+    written = 0
+    if not dry_run:
+        for start in range(0, len(payments), chunk_size):
+            db.session.execute(db.insert(Payment), payments[start:start + chunk_size])
+        updates = [{"id": tenant_id, **{columns[b]: True for b in bills}} for tenant_id, bills in paid_flags.items()]
+        for start in range(0, len(updates), chunk_size):
+            db.session.execute(db.update(Tenant), updates[start:start + chunk_size])
+
+        record_collections(payments)
+        written = len(payments)
+    done = time.perf_counter()
+
+    stats = matcher.stats
+    return {
+        **stats,
+        "match_rate": round(stats["matched"] * 100 / stats["lines"], 2) if stats["lines"] else 0,
+        "payments_created": written,
+        "tenants_updated": len(paid_flags) if not dry_run else 0,
+        "dry_run": dry_run,
+        "timings_ms": {
+            "index": round((indexed - started) * 1000, 2),
+            "match": round((matched - indexed) * 1000, 2),
+            "write": round((done - matched) * 1000, 2),
+        },
+        "lines_per_second": int(len(lines) / (done - started)) if done > started else None,
+        "unmatched": unmatched,
+    }
+
+
+# Synthetic statement: most lines carry a reference, email or exact name, some
+# a misspelled name, some nothing usable at all
+def benchmark(tenants: int, lines: int) -> None:
+    import random
+
+    rng = random.Random(0)
+    first = ["John", "Mary", "Peter", "Grace", "James", "Faith", "David", "Mercy", "Brian", "Joy",
+             "Kevin", "Ann", "Samuel", "Esther", "Daniel", "Ruth", "Paul", "Lucy", "Mark", "Alice"]
+    last = [f"{a}{b}{c}" for a in ("Ka", "Wa", "O", "Mu", "Ndi", "Ki", "Ochi", "Nje", "Mwa", "Ti")
+            for b in ("ma", "nji", "te", "tu", "ge", "pro", "e", "ri", "ngi", "ke")
+            for c in ("u", "ku", "no", "a", "ge", "ng", "ri", "mbi", "ni", "to")]
+    rent_prices = {"Bedsitter": 5000, "1-Bedroom": 8000, "2-Bedroom": 12000, "Studio": 6000}
+    utility_bills = {"water": 800, "electricity": 1200}
+
+    rows = []
+    for tenant_id in range(1, tenants + 1):
+        name = f"{rng.choice(first)} {rng.choice(last)} {rng.choice(last)}"
+        rows.append((tenant_id, name, f"tenant{tenant_id}@example.com", rng.choice(list(rent_prices)),
+                     False, False, False))
+
+    def typo(name):
+        i = rng.randrange(len(name))
+        return name[:i] + name[i + 1:]
+
+    statement = []
+    for number in range(lines):
+        tenant_id, name, email, room_type = rows[rng.randrange(tenants)][:4]
+        amount = rng.choice([rent_prices[room_type], 800, 1200, 2000])
+        kind = rng.random()
+        line = {"line": number + 2, "date": "2026-10-01", "reference": "", "payer": "", "email": "",
+                "cents": amount * 100}
+        if kind < 0.4:
+            line["reference"] = f"RENT T{tenant_id}"
+        elif kind < 0.6:
+            line["email"] = email
+        elif kind < 0.85:
+            line["payer"] = " ".join(reversed(name.upper().split()))
+        elif kind < 0.95:
+            line["payer"] = typo(name)
+        else:
+            line["payer"] = "UNKNOWN DEPOSIT"
+        statement.append(line)
+
+    started = time.perf_counter()
+    matcher = Matcher(rows, rent_prices, utility_bills)
+    indexed = time.perf_counter()
+    for line in statement:
+        matcher.match(line)
+    done = time.perf_counter()
+
+    stats = matcher.stats
+    print(f"tenants={tenants} lines={lines}")
+    print(f"   - index build: {(indexed - started) * 1000:.1f} ms")
+    print(f"   - matching:    {(done - indexed) * 1000:.1f} ms ({int(lines / (done - indexed))} lines/s)")
+    print(f"   - match rate:  {stats['matched'] * 100 / lines:.1f}%")
+    print(f"   - {stats}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark statement matching")
+    parser.add_argument("--tenants", type=int, default=100_000)
+    parser.add_argument("--lines", type=int, default=100_000)
+    args = parser.parse_args()
+    benchmark(args.tenants, args.lines)
@@ -0,0 +1,201 @@
+# revocation.py
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+# Fixed-size Bloom filter over strings: no false negatives, a false-positive
+# rate of about `error_rate` while it holds no more than `capacity` keys
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+# Per-process copy of the revoked_tokens table. Lookups touch only memory: a
+# Bloom filter answers "not revoked" for almost every live token, and the exact
+# set settles the rare filter hits. The copy is loaded on first use and then
+# kept fresh by a background thread on its own connection, so an auth check
+# never queries or commits on the request's session. Every
+# REVOCATION_SYNC_INTERVAL seconds the thread pulls rows revoked since its last
+# pull (minus REVOCATION_SYNC_MARGIN, so rows from transactions that committed
+# late are not missed), and every REVOCATION_REBUILD_INTERVAL seconds it
+# rebuilds the list to drop expired entries. Revocations made by this process
+# apply as soon as they commit; those made by other workers after their next sync.
+class RevocationList:
+    def __init__(self, app=None):
+        self.app = None
+        self.sync_interval = 5.0
+        self.sync_margin = 60.0
+        self.rebuild_interval = 3600.0
+        self.capacity = 100000
+        self._filter = BloomFilter(self.capacity)
+        self._revoked = {}  # jti -> expires_at
+        self._pulled_at = None  # app clock when the last pull started
+        self._rebuilt_at = None
+        self._load_attempted = False
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._thread = None
+        self._stats = {"checks": 0, "filter_hits": 0, "false_positives": 0, "revoked_hits": 0,
+                       "syncs": 0, "rebuilds": 0, "sync_errors": 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.app = app
+        self.sync_interval = app.config.get("REVOCATION_SYNC_INTERVAL", 5.0)
+        self.sync_margin = app.config.get("REVOCATION_SYNC_MARGIN", 60.0)
+        self.rebuild_interval = app.config.get("REVOCATION_REBUILD_INTERVAL", 3600.0)
+        self.capacity = app.config.get("REVOCATION_BLOOM_CAPACITY", 100000)
+        self._filter = BloomFilter(self.capacity)
+
+    def _add(self, jti: str, expires_at) -> None:
+        if jti in self._revoked:
+            return
+        self._revoked[jti] = expires_at
+        self._filter.add(jti)
+        if self._filter.count > self._filter.capacity:
+            self._refilter(self._filter.capacity * 2)
+
+    def _refilter(self, capacity: int) -> None:
+        self._filter = BloomFilter(capacity)
+        for jti in self._revoked:
+            self._filter.add(jti)
+
+    def _rebuild(self) -> None:
+        from extensions import db
+        from models.token import RevokedToken
+
+        now = datetime.utcnow()
+        with self.app.app_context(), db.engine.begin() as conn:
+            conn.execute(db.delete(RevokedToken).where(RevokedToken.expires_at < now))
+            rows = conn.execute(db.select(RevokedToken.jti, RevokedToken.expires_at)).all()
+
+        revoked = {row.jti: row.expires_at for row in rows}
+        with self._lock:
+            # Keep anything revoked locally while the rebuild was running
+            revoked.update({j: e for j, e in self._revoked.items() if e >= now})
+            self._revoked = revoked
+            self._refilter(max(self.capacity, len(revoked) * 2))
+            self._pulled_at = now
+            self._rebuilt_at = time.monotonic()
+            self._stats["rebuilds"] += 1
+
+    def _pull(self) -> None:
+        from extensions import db
+        from models.token import RevokedToken
+
+        now = datetime.utcnow()
+        since = self._pulled_at - timedelta(seconds=self.sync_margin)
+        with self.app.app_context(), db.engine.connect() as conn:
+            rows = conn.execute(
+                db.select(RevokedToken.jti, RevokedToken.expires_at)
+                .where(RevokedToken.revoked_at >= since)
+            ).all()
+        with self._lock:
+            for row in rows:
+                self._add(row.jti, row.expires_at)
+            self._pulled_at = now
+            self._stats["syncs"] += 1
+
+    def sync(self) -> None:
+        if self._rebuilt_at is None or time.monotonic() - self._rebuilt_at > self.rebuild_interval:
+            self._rebuild()
+        else:
+            self._pull()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.sync_interval)
+            try:
+                self.sync()
+            except Exception:
+                # Keep serving from the copy we have; retry after the next interval
+                self._stats["sync_errors"] += 1
+
+    # Only the first check loads inline. If that load fails, the sync thread
+    # keeps retrying the rebuild every sync_interval; requests don't each hit
+    # the database while it is down.
+    def _ensure_loaded(self) -> None:
+        if not self._load_attempted:
+            with self._load_lock:
+                if not self._load_attempted:
+                    self._load_attempted = True
+                    try:
+                        self._rebuild()
+                    except Exception:
+                        self._stats["sync_errors"] += 1
+        # Started lazily so forked workers each get their own sync thread
+        if self._thread is None or not self._thread.is_alive():
+            with self._load_lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+
+    # True if any of the given ids (token id, refresh-token family) is revoked
+    def is_revoked(self, *jtis) -> bool:
+        self._ensure_loaded()
+        self._stats["checks"] += 1
+        for jti in jtis:
+            if not jti or jti not in self._filter:
+                continue
+            self._stats["filter_hits"] += 1
+            if jti in self._revoked:
+                self._stats["revoked_hits"] += 1
+                return True
+            self._stats["false_positives"] += 1
+        return False
+
+    # Revoke a token id (or family id) until it would have expired anyway, with
+    # one conditional INSERT in the caller's transaction. Returns False if it
+    # was already revoked, which makes it safe to use as a claim: of two
+    # concurrent calls for the same jti only one gets True. Call remember()
+    # once the caller has committed.
+    def revoke(self, jti: str, expires_at: datetime) -> bool:
+        from extensions import db
+        from models.token import RevokedToken
+
+        row = {"jti": jti, "expires_at": expires_at, "revoked_at": datetime.utcnow()}
+        dialect = db.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            if db.session.execute(db.select(RevokedToken.id).where(RevokedToken.jti == jti)).first():
+                return False
+            db.session.execute(db.insert(RevokedToken), [row])
+            return True
+        stmt = insert(RevokedToken).values(**row).on_conflict_do_nothing(index_elements=["jti"])
+        return db.session.execute(stmt).rowcount == 1
+
+    # Apply a committed revocation to this worker's copy right away
+    def remember(self, jti: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._add(jti, expires_at)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, entries=len(self._revoked), filter_bits=self._filter.size,
+                        filter_hashes=self._filter.hashes,
+                        pulled_at=self._pulled_at.isoformat() if self._pulled_at else None)
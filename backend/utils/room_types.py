@@ -0,0 +1,68 @@
+# room_types.py
+import re
+import threading
+import time
+
+# Room types every deployment has, in id order (the migration inserts them so)
+DEFAULT_ROOM_TYPES = ["Bedsitter", "Studio", "1-Bedroom", "2-Bedroom", "3-Bedroom"]
+
+
+# Lookup key for a room type name: lowercase, no spaces or dashes, so
+# "1bedroom", "1 Bedroom" and "1-Bedroom" all find the same row
+def squash(name: str) -> str:
+    return re.sub(r"[\s\-_]", "", name or "").lower()
+
+
+# Process-wide id <-> name map for the room_types table. The table is tiny and
+# rows are never renamed, so it is read once. A name or id that is missing (a
+# type added by another worker, or just an unknown one) triggers a re-read at
+# most once per reload_interval seconds; other misses answer None from memory.
+class RoomTypeMap:
+    def __init__(self, reload_interval: float = 60.0):
+        self.reload_interval = reload_interval
+        self._by_id = {}
+        self._by_key = {}
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        from extensions import db
+        from models.room_type import RoomType
+
+        rows = db.session.execute(db.select(RoomType.id, RoomType.name)).all()
+        with self._lock:
+            self._by_id = {row.id: row.name for row in rows}
+            self._by_key = {squash(row.name): row.id for row in rows}
+            self._loaded_at = time.monotonic()
+
+    def _reload_on_miss(self) -> None:
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > self.reload_interval:
+            self.load()
+
+    def id_for(self, name: str):
+        if not name:
+            return None
+        key = squash(name)
+        if key not in self._by_key:
+            self._reload_on_miss()
+        return self._by_key.get(key)
+
+    def name_for(self, room_type_id: int):
+        if room_type_id is None:
+            return None
+        if room_type_id not in self._by_id:
+            self._reload_on_miss()
+        return self._by_id.get(room_type_id)
+
+    # Insert any default room types the table is missing (fresh databases
+    # created with db.create_all() instead of migrations)
+    def ensure_defaults(self) -> None:
+        from extensions import db
+        from models.room_type import RoomType
+
+        self.load()
+        missing = [name for name in DEFAULT_ROOM_TYPES if squash(name) not in self._by_key]
+        if missing:
+            db.session.add_all([RoomType(name=name) for name in missing])
+            db.session.flush()
+            self.load()
@@ -0,0 +1,83 @@
+# search.py
+from extensions import db, room_types
+from models.tenant import Tenant
+from models.house import House
+
+# Highest code point, used to turn a prefix into an index-friendly range
+PREFIX_END = "\uffff"
+
+
+def _is_postgres() -> bool:
+    return db.session.get_bind().dialect.name == "postgresql"
+
+
+# Escape LIKE wildcards so user input only ever matches literally
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Search tenants by name, email or house number, best matches first.
+# Candidates come from a UNION of one branch per match kind, so each branch
+# can use its own index instead of an OR over an outer join scanning tenants:
+# PostgreSQL uses the pg_trgm GIN index for fuzzy names and the
+# varchar_pattern_ops btrees for prefix LIKE; other databases use prefix
+# ranges over the lower() expression indexes. House numbers go through
+# ix_houses_number and ix_tenants_house_id.
+def search_tenants(q: str, limit: int = 20) -> list:
+    term = q.strip()
+    q = term.lower()
+    if not q:
+        return []
+
+    name = db.func.lower(Tenant.name)
+    email = db.func.lower(Tenant.email)
+    prefix = escape_like(q) + "%"
+
+    if _is_postgres():
+        name_prefix = name.like(prefix, escape="\\")
+        email_prefix = email.like(prefix, escape="\\")
+        branches = [name.op("%")(q), name_prefix, email_prefix]
+        score = db.func.greatest(db.func.similarity(name, q), db.func.similarity(email, q))
+    else:
+        name_prefix = db.and_(name >= q, name < q + PREFIX_END)
+        email_prefix = db.and_(email >= q, email < q + PREFIX_END)
+        branches = [name_prefix, email_prefix]
+        score = db.literal(0.0)
+
+    house_ids = db.select(House.id).where(House.number == term)
+    candidates = db.union(
+        *[db.select(Tenant.id).where(branch) for branch in branches],
+        db.select(Tenant.id).where(Tenant.house_id.in_(house_ids))
+    ).subquery()
+
+    # Exact name/email first, then name prefix, email prefix, house number, then fuzzy
+    rank = db.case(
+        (db.or_(name == q, email == q), 0),
+        (name_prefix, 1),
+        (email_prefix, 2),
+        (House.number == term, 3),
+        else_=4,
+    )
+
+    rows = db.session.execute(
+        db.select(Tenant.id, Tenant.name, Tenant.email, Tenant.room_type_id,
+                  Tenant.house_id, House.number, rank.label("rank"), score.label("score"))
+        .join(candidates, candidates.c.id == Tenant.id)
+        .outerjoin(House, House.id == Tenant.house_id)
+        .order_by(rank, score.desc(), Tenant.name, Tenant.id)
+        .limit(limit)
+    ).all()
+
+    return [
+        {
+            "id": r.id,
+            "name": r.name,
+            "email": r.email,
+            "room_type": room_types.name_for(r.room_type_id) or "Not Selected",
+            "house_id": r.house_id,
+            "house_number": r.number,
+            "rank": r.rank,
+            "score": round(float(r.score), 3)
+        }
+        for r in rows
+    ]
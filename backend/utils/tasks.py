@@ -0,0 +1,20 @@
+# tasks.py
+# Background job handlers. Imported by worker.py so they are registered.
+from extensions import db
+from models.payment import Payment
+from models.messages import Message
+from utils.jobs import job_handler
+
+
+@job_handler("payment_receipt")
+def send_payment_receipt(payload: dict) -> None:
+    payment = db.session.get(Payment, payload["payment_id"])
+    if payment is None:
+        return  # tenant moved out before the job ran
+
+    db.session.add(Message(
+        tenant_id=payment.tenant_id,
+        title=f"Receipt: {payment.payment_type} payment",
+        content=f"We received your {payment.payment_type} payment of {float(payment.amount):.2f}. "
+                f"Reference #{payment.id}."
+    ))
@@ -0,0 +1,80 @@
+"""
+Background job worker
+Run from backend directory: python worker.py --concurrency 4
+"""
+
+import argparse
+import threading
+import traceback
+from app import app
+from extensions import db
+from utils.jobs import claim_job, run_job, requeue_stale_jobs
+import utils.tasks  # noqa: F401  (registers job handlers)
+
+
+# A failed iteration (database down, a commit that raised) must not kill the
+# thread: roll back, log, and back off before trying again
+def work(stop: threading.Event, poll_interval: float) -> None:
+    with app.app_context():
+        errors = 0
+        while not stop.is_set():
+            try:
+                job = claim_job()
+                if job is None:
+                    errors = 0
+                    stop.wait(poll_interval)
+                    continue
+                ok = run_job(job)
+                errors = 0
+                print(f"   - job {job.id} {job.name}: {'done' if ok else job.status} (attempt {job.attempts})")
+            except Exception:
+                errors += 1
+                db.session.rollback()
+                print(f"❌ Worker loop error (retrying):\n{traceback.format_exc()}")
+                stop.wait(min(poll_interval * 2 ** errors, 60))
+
+
+# Periodically requeue (or fail) jobs whose worker died mid-run
+def sweep(stop: threading.Event, interval: float) -> None:
+    with app.app_context():
+        while not stop.wait(interval):
+            try:
+                requeued, failed = requeue_stale_jobs()
+                if requeued or failed:
+                    print(f"   - stale jobs: {requeued} requeued, {failed} failed")
+            except Exception:
+                db.session.rollback()
+                print(f"❌ Stale job sweep failed:\n{traceback.format_exc()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background jobs")
+    parser.add_argument("--concurrency", type=int, default=app.config.get("WORKER_CONCURRENCY", 4))
+    parser.add_argument("--poll", type=float, default=1.0, help="seconds to sleep when the queue is empty")
+    args = parser.parse_args()
+
+    with app.app_context():
+        requeued, failed = requeue_stale_jobs()
+    print(f"✅ Worker started with {args.concurrency} thread(s), "
+          f"{requeued} stale job(s) requeued, {failed} failed")
+
+    stop = threading.Event()
+    threads = [threading.Thread(target=work, args=(stop, args.poll), daemon=True)
+               for _ in range(args.concurrency)]
+    threads.append(threading.Thread(target=sweep, args=(stop, app.config.get("JOB_SWEEP_INTERVAL", 60)),
+                                    daemon=True))
+    for t in threads:
+        t.start()
+
+    try:
+        while True:
+            stop.wait(1)
+    except KeyboardInterrupt:
+        print("Stopping worker...")
+        stop.set()
+        for t in threads:
+            t.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,111 +1,112 @@
-import { useState } from "react";
-import { useNavigate } from "react-router-dom";
-import "../styles/Login.css";
-
-export default function Login() {
-  const navigate = useNavigate();
-  const [email, setEmail] = useState("");
-  const [password, setPassword] = useState("");
-  const [loading, setLoading] = useState(false);
-  const [errors, setErrors] = useState({});
-
-  const validateForm = () => {
-    const newErrors = {};
-    
-    if (!email.trim()) newErrors.email = "Email is required";
-    else if (!/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email)) newErrors.email = "Invalid email";
-    
-    if (!password) newErrors.password = "Password is required";
-    
-    setErrors(newErrors);
-    return Object.keys(newErrors).length === 0;
-  };
-
-  const login = async (e) => {
-    e.preventDefault();
-    
-    if (!validateForm()) return;
-    
-    setLoading(true);
-    try {
-      const res = await fetch("http://localhost:5000/auth/login", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ email, password })
-      });
-
-      const data = await res.json();
-
-      if (!res.ok) {
-        setErrors({ submit: data.error || "Login failed" });
-        setLoading(false);
-        return;
-      }
-
-      localStorage.setItem("token", data.token);
-      localStorage.setItem("role", data.user.role);
-      localStorage.setItem("userName", data.user.name);
-
-      // Redirect tenant to room selection, landlord to dashboard
-      navigate(data.user.role === "landlord" ? "/landlord" : "/room-selection");
-    } catch (err) {
-      setErrors({ submit: "Network error. Please try again." });
-      setLoading(false);
-    }
-  };
-
-  return (
-    <div className="auth-container">
-      <div className="auth-card">
-        <div className="auth-header">
-          <h1>Sign In</h1>
-          <p>to your account</p>
-        </div>
-
-        <form onSubmit={login} className="auth-form">
-          {errors.submit && <div className="error-message">{errors.submit}</div>}
-
-          <div className="form-group">
-            <label htmlFor="email">Email Address</label>
-            <input
-              id="email"
-              type="email"
-              placeholder="you@example.com"
-              value={email}
-              onChange={e => {
-                setEmail(e.target.value);
-                if (errors.email) setErrors({...errors, email: ""});
-              }}
-              className={errors.email ? "input-error" : ""}
-            />
-            {errors.email && <span className="field-error">{errors.email}</span>}
-          </div>
-
-          <div className="form-group">
-            <label htmlFor="password">Password</label>
-            <input
-              id="password"
-              type="password"
-              placeholder="Enter your password"
-              value={password}
-              onChange={e => {
-                setPassword(e.target.value);
-                if (errors.password) setErrors({...errors, password: ""});
-              }}
-              className={errors.password ? "input-error" : ""}
-            />
-            {errors.password && <span className="field-error">{errors.password}</span>}
-          </div>
-
-          <button type="submit" className="auth-button" disabled={loading}>
-            {loading ? "Signing in..." : "Sign In"}
-          </button>
-        </form>
-
-        <div className="auth-footer">
-          <p>Don't have an account? <a href="/signup">Sign Up</a></p>
-        </div>
-      </div>
-    </div>
-  );
-}
+import { useState } from "react";
+import { useNavigate } from "react-router-dom";
+import "../styles/Login.css";
+
+export default function Login() {
+  const navigate = useNavigate();
+  const [email, setEmail] = useState("");
+  const [password, setPassword] = useState("");
+  const [loading, setLoading] = useState(false);
+  const [errors, setErrors] = useState({});
+
+  const validateForm = () => {
+    const newErrors = {};
+    
+    if (!email.trim()) newErrors.email = "Email is required";
+    else if (!/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email)) newErrors.email = "Invalid email";
+    
+    if (!password) newErrors.password = "Password is required";
+    
+    setErrors(newErrors);
+    return Object.keys(newErrors).length === 0;
+  };
+
+  const login = async (e) => {
+    e.preventDefault();
+    
+    if (!validateForm()) return;
+    
+    setLoading(true);
+    try {
+      const res = await fetch("http://localhost:5000/auth/login", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ email, password })
+      });
+
+      const data = await res.json();
+
+      if (!res.ok) {
+        setErrors({ submit: data.error || "Login failed" });
+        setLoading(false);
+        return;
+      }
+
+      localStorage.setItem("token", data.token);
+      localStorage.setItem("refreshToken", data.refresh_token);
+      localStorage.setItem("role", data.user.role);
+      localStorage.setItem("userName", data.user.name);
+
+      // Redirect tenant to room selection, landlord to dashboard
+      navigate(data.user.role === "landlord" ? "/landlord" : "/room-selection");
+    } catch (err) {
+      setErrors({ submit: "Network error. Please try again." });
+      setLoading(false);
+    }
+  };
+
+  return (
+    <div className="auth-container">
+      <div className="auth-card">
+        <div className="auth-header">
+          <h1>Sign In</h1>
+          <p>to your account</p>
+        </div>
+
+        <form onSubmit={login} className="auth-form">
+          {errors.submit && <div className="error-message">{errors.submit}</div>}
+
+          <div className="form-group">
+            <label htmlFor="email">Email Address</label>
+            <input
+              id="email"
+              type="email"
+              placeholder="you@example.com"
+              value={email}
+              onChange={e => {
+                setEmail(e.target.value);
+                if (errors.email) setErrors({...errors, email: ""});
+              }}
+              className={errors.email ? "input-error" : ""}
+            />
+            {errors.email && <span className="field-error">{errors.email}</span>}
+          </div>
+
+          <div className="form-group">
+            <label htmlFor="password">Password</label>
+            <input
+              id="password"
+              type="password"
+              placeholder="Enter your password"
+              value={password}
+              onChange={e => {
+                setPassword(e.target.value);
+                if (errors.password) setErrors({...errors, password: ""});
+              }}
+              className={errors.password ? "input-error" : ""}
+            />
+            {errors.password && <span className="field-error">{errors.password}</span>}
+          </div>
+
+          <button type="submit" className="auth-button" disabled={loading}>
+            {loading ? "Signing in..." : "Sign In"}
+          </button>
+        </form>
+
+        <div className="auth-footer">
+          <p>Don't have an account? <a href="/signup">Sign Up</a></p>
+        </div>
+      </div>
+    </div>
+  );
+}